@@ -5,6 +5,9 @@ from .qdrant_vector import _import_fastembed
 from ._text_splitter_base import TextSplitterInterface
 
 
+_SENTENCE_END_PATTERN = re.compile(r'(?<=[。！？\.!?])')
+
+
 class SemanticTextSplitter(TextSplitterInterface):
     """
     A class that splits text into smaller pieces based on semantic similarity and sentence count.
@@ -64,7 +67,7 @@ class SemanticTextSplitter(TextSplitterInterface):
         Returns:
             Iterable[str]: The chunks of text.
         """
-        sentences = re.split(r'(?<=[。！？\.!?])', text)
+        sentences = _SENTENCE_END_PATTERN.split(text)
         sentences = [sentence for sentence in sentences if sentence.strip()]
 
         for i in range(0, len(sentences), max_sentences):
@@ -74,16 +77,6 @@ class SemanticTextSplitter(TextSplitterInterface):
     def _get_embeddings(self, texts: str | list[str]):
         return self.embedding_model.embed(texts)
 
-    def _cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
-        """Calculate the cosine similarity between two vectors."""
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude_vec1 = sum(a ** 2 for a in vec1) ** 0.5
-        magnitude_vec2 = sum(b ** 2 for b in vec2) ** 0.5
-        if magnitude_vec1 == 0 or magnitude_vec2 == 0:
-            return 0
-        else:
-            return dot_product / (magnitude_vec1 * magnitude_vec2)
-    
     def split_by_semantic(self, text: str) -> Iterable[str]:
         """
         Split the text into chunks based on semantic similarity.
@@ -163,22 +156,27 @@ class SemanticTextSplitter(TextSplitterInterface):
         return sorted_distances[index]
 
     def _calculate_cosine_distances(self, sentences):
-        distances = []
-        for i in range(len(sentences) - 1):
-            embedding_current = sentences[i]['combined_sentence_embedding']
-            embedding_next = sentences[i + 1]['combined_sentence_embedding']
-            
-            # Calculate cosine similarity
-            similarity = self._cosine_similarity(embedding_current.tolist(), embedding_next.tolist())
-            
-            # Convert to cosine distance
-            distance = 1 - similarity
+        import numpy as np
+
+        if not sentences:
+            return [], sentences
+
+        # Normalize all embeddings at once, zero vectors are left as they are,
+        # so their similarity to any other vector is 0.
+        embeddings = np.vstack([x['combined_sentence_embedding'] for x in sentences]).astype(np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        embeddings /= norms
+
+        # Cosine similarity between every sentence and the next one
+        similarities = np.einsum('ij,ij->i', embeddings[:-1], embeddings[1:])
 
-            # Append cosine distance to the list
-            distances.append(distance)
+        # Convert to cosine distance
+        distances = (1 - similarities).tolist()
 
-            # Store distance in the dictionary
-            sentences[i]['distance_to_next'] = distance
+        # Store distance in the dictionary
+        for sentence, distance in zip(sentences, distances):
+            sentence['distance_to_next'] = distance
 
         # Optionally handle the last sentence
         # sentences[-1]['distance_to_next'] = None  # or a default value
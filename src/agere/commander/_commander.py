@@ -2,6 +2,7 @@ from __future__ import annotations
 import asyncio
 import itertools
 import logging
+import os
 import sys
 import threading
 import weakref
@@ -198,6 +199,22 @@ class TaskNode:
 T = TypeVar('T')
 
 
+def _new_event_loop() -> AbstractEventLoop:
+    """Create the event loop for the commander loop.
+
+    If the environment variable AGERE_UVLOOP is set to "1" and uvloop is installed,
+    a uvloop event loop is used, otherwise the default asyncio event loop is used.
+    """
+    if os.environ.get("AGERE_UVLOOP") == "1":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
 class CommanderAsyncInterface(TaskNode, Generic[T], metaclass=ABCMeta):
     @property
     @abstractmethod
@@ -256,6 +273,10 @@ class CommanderAsync(CommanderAsyncInterface[T]):
         self.logger = logger or get_null_logger()
         self._threadsafe_waiting_tasks = set()
         self._threadsafe_waiting_tasks_lock = threading.Lock()
+        # Mirror running_status and is_empty() so that other threads can block on them instead of polling.
+        self._running_event = threading.Event()
+        self._empty_event = threading.Event()
+        self._empty_event.set()
 
     @property
     def running_status(self) -> bool:
@@ -272,6 +293,46 @@ class CommanderAsync(CommanderAsyncInterface[T]):
             status = self.__job_queue.empty() and not self._children and not self._threadsafe_waiting_tasks
         return status
 
+    def wait_until_running(self, timeout: float | None = None) -> bool:
+        """Block until the commander loop is running.
+
+        This waits for running_status to become True without polling it.
+        The commander is ready to accept threadsafe calls when this returns True.
+
+        Args:
+            timeout: The maximum number of seconds to wait, None means waiting indefinitely.
+
+        Returns:
+            bool: True if the commander loop is running, False if the wait timed out.
+        """
+        return self._running_event.wait(timeout)
+
+    def wait_until_empty(self, timeout: float | None = None) -> bool:
+        """Block until the commander (task status) is empty.
+
+        This waits for the same condition as is_empty() without polling it.
+        It should not be called from within the commander thread, as that would block the commander loop.
+
+        Args:
+            timeout: The maximum number of seconds to wait, None means waiting indefinitely.
+
+        Returns:
+            bool: True if the commander became empty, False if the wait timed out.
+        """
+        return self._empty_event.wait(timeout)
+
+    def _refresh_empty_event(self) -> None:
+        """Set or clear the _empty_event according to the current task status.
+
+        The event is only ever set from within the commander thread,
+        other threads only clear it when they add something to the commander.
+        """
+        with self._threadsafe_waiting_tasks_lock:
+            if self.__job_queue.empty() and not self._children and not self._threadsafe_waiting_tasks:
+                self._empty_event.set()
+            else:
+                self._empty_event.clear()
+
     def run(self, job: Job | Sequence[Job] | None = None, auto_exit: bool = False, new_queue: bool = True) -> None | T:
         """Start the commander loop.
 
@@ -311,8 +372,11 @@ class CommanderAsync(CommanderAsyncInterface[T]):
             self.__thread_exit_event.clear()
             if new_queue is True:
                 self.__job_queue = asyncio.Queue()
-            self._event_loop = asyncio.new_event_loop()
+            if job is not None:
+                self._empty_event.clear()
+            self._event_loop = _new_event_loop()
             asyncio.set_event_loop(self._event_loop)
+            self._running_event.set()
         try:
             self._event_loop.create_task(self._commander_async(job, auto_exit))
             self._event_loop.run_forever()
@@ -357,8 +421,7 @@ class CommanderAsync(CommanderAsyncInterface[T]):
                 if job is not None:
                     if not isinstance(job, Iterable):
                         job = [job]
-                    for one_job in job:
-                        self.put_job_threadsafe(one_job)
+                    self.put_jobs_threadsafe(job)
                 return False
             # The wait here is to ensure that the (potential) commander thread truly terminates.
             # This won't result in a deadlock because if waiting actually occurs here, it indicates that
@@ -370,8 +433,11 @@ class CommanderAsync(CommanderAsyncInterface[T]):
             self.__thread_exit_event.clear()
             if new_queue is True:
                 self.__job_queue = asyncio.Queue()
-            self._event_loop = asyncio.new_event_loop()
+            if job is not None:
+                self._empty_event.clear()
+            self._event_loop = _new_event_loop()
             asyncio.set_event_loop(self._event_loop)
+            self._running_event.set()
         try:
             self._event_loop.create_task(self._commander_async(job, auto_exit))
             self._event_loop.run_forever()
@@ -396,6 +462,7 @@ class CommanderAsync(CommanderAsyncInterface[T]):
             if self.__running is False:
                 return
             self.__running = False
+            self._running_event.clear()
             job = ComEnd()
             job._parent = "Null"
             job._commander = self
@@ -414,6 +481,7 @@ class CommanderAsync(CommanderAsyncInterface[T]):
                 return
             #self.__loop_exit_event.clear()
             self.__running = False
+            self._running_event.clear()
             job = ComEnd()
             job._parent = "Null"
             job._commander = self
@@ -440,6 +508,28 @@ class CommanderAsync(CommanderAsyncInterface[T]):
         self.__thread_exit_event.wait()
         return self._return_result
 
+    def reset(self) -> None:
+        """Reset the task status of a stopped commander so that it can be reused.
+
+        It waits for the (potential) commander thread to finish, then discards the residual jobs,
+        children, pending threadsafe submissions, commander end callbacks and the return result.
+
+        Raises:
+            CommanderAlreadyRunningError: Throw this exception when the commander loop is running.
+        """
+        with self._running_lock:
+            if self.__running is True:
+                raise CommanderAlreadyRunningError(f"Can not reset a running commander, commander: {self!r}")
+            self.__thread_exit_event.wait()
+            self.__job_queue = asyncio.Queue()
+            self._children = []
+            self._state = "PENDING"
+            self._callbacks_at_commander_end_list = []
+            self._return_result = None
+            with self._threadsafe_waiting_tasks_lock:
+                self._threadsafe_waiting_tasks = set()
+            self._empty_event.set()
+
     async def _commander_async(self, init_job: Job | Sequence[Job] | None = None, auto_exit: bool = False) -> None:
         """The core of the commander, runs a loop to dispatch tasks.
 
@@ -461,6 +551,7 @@ class CommanderAsync(CommanderAsyncInterface[T]):
                 init_job = [init_job]
             for job in init_job:
                 await self._put_job(job=job, parent=self)
+        self._refresh_empty_event()
         
         while self.__running:
             # stop condition
@@ -471,6 +562,7 @@ class CommanderAsync(CommanderAsyncInterface[T]):
                         with self._threadsafe_waiting_tasks_lock:
                             if self.__job_queue.empty() and not self._children and not self._threadsafe_waiting_tasks:
                                 self.__running = False
+                                self._running_event.clear()
                                 break
                     finally:
                         self._running_lock.release()
@@ -494,10 +586,12 @@ class CommanderAsync(CommanderAsyncInterface[T]):
             if getattr(job_task, "__tasker__", None) is not True:
                 raise NotTaskerError(f"Task method of {job!r} is not a Tasker.")
             await job_task()
+            self._refresh_empty_event()
 
         for callback in self._callbacks_at_commander_end_list:
             await self._handle_callback(callback=callback, which="at_commander_end")
         self._callbacks_at_commander_end_list = []
+        self._refresh_empty_event()
         # To ensure the order of setting __loop_exit_event and __thread_exit_event.
         # __loop_exit_event.set() must be executed first, followed by _event_loop.stop()
         self.__loop_exit_event.set()
@@ -516,36 +610,25 @@ class CommanderAsync(CommanderAsyncInterface[T]):
             callbact_list = getattr(callback, which)
         except AttributeError:
             raise ValueError(f"Callback have no '{which}' callback.")
+        if not callbact_list:
+            return
+        if task_node is None:
+            task_node = callback._task_node
         for callback_job in callbact_list:
             function = callback_job["function"]
             params = callback_job.get("params")
-            inject_task_node = callback_job.get("inject_task_node", False)
-            if task_node is None:
-                task_node = callback._task_node
             if params is None:
-                if inject_task_node:
-                    if iscoroutinefunction(function):
-                        await function(task_node=task_node)
-                    else:
-                        function(task_node=task_node)
-                else:
-                    if iscoroutinefunction(function):
-                        await function()
-                    else:
-                        function()
+                args = ()
+                kwargs = {}
             else:
                 args = params.get("args", ())
                 kwargs = params.get("kwargs", {})
-                if inject_task_node:
-                    if iscoroutinefunction(function):
-                        await function(*args, **kwargs, task_node=task_node)
-                    else:
-                        function(*args, **kwargs, task_node=task_node)
-                else:
-                    if iscoroutinefunction(function):
-                        await function(*args, **kwargs)
-                    else:
-                        function(*args, **kwargs)
+            if callback_job.get("inject_task_node", False):
+                result = function(*args, **kwargs, task_node=task_node)
+            else:
+                result = function(*args, **kwargs)
+            if iscoroutinefunction(function):
+                await result
 
     async def _do_at_done(self) -> None:
         job = ComEnd()
@@ -554,6 +637,10 @@ class CommanderAsync(CommanderAsyncInterface[T]):
         await self.__job_queue.put(job)
 
     async def _put_job(self, job: Job, parent: TaskNode | None = None, requester: TaskNode | None = None) -> None:
+        self._put_job_nowait(job=job, parent=parent, requester=requester)
+
+    def _put_job_nowait(self, job: Job, parent: TaskNode | None = None, requester: TaskNode | None = None) -> None:
+        # The __job_queue is unbounded, so putting a job never has to wait and can be done synchronously.
         if parent is None:
             parent = self
         if requester is None:
@@ -568,7 +655,7 @@ class CommanderAsync(CommanderAsyncInterface[T]):
             job.commander.put_job_threadsafe(job)
             return
         
-        await self.__job_queue.put(job)
+        self.__job_queue.put_nowait(job)
 
     def put_job_threadsafe(self, job: Job) -> None:
         """Add a job to this commander in a thread-safe manner.
@@ -579,14 +666,33 @@ class CommanderAsync(CommanderAsyncInterface[T]):
         event_loop = self._event_loop
         if event_loop is None:
             raise CommanderNotRunError(f"Commander is not running, commander: {self!r}.")
-        future = asyncio.run_coroutine_threadsafe(self._put_job(job), event_loop)
+        put_job_threadsafe_wrapper = self.CallHandlerThreadsafeWrapper(self._put_job_nowait, job)
         with self._threadsafe_waiting_tasks_lock:
-            self._threadsafe_waiting_tasks.add(future)
+            self._threadsafe_waiting_tasks.add(put_job_threadsafe_wrapper)
+            self._empty_event.clear()
+        event_loop.call_soon_threadsafe(self._wrap_call_handler, put_job_threadsafe_wrapper)
 
-        def wrap_discard(obj):
-            with self._threadsafe_waiting_tasks_lock:
-                self._threadsafe_waiting_tasks.discard(obj)
-        future.add_done_callback(wrap_discard)
+    def put_jobs_threadsafe(self, jobs: Iterable[Job]) -> None:
+        """Add several jobs to this commander in a thread-safe manner.
+
+        All the jobs are handed over to the commander thread at once,
+        instead of waking up the commander loop for each job.
+
+        Raises:
+            CommanderNotRunError: Throw this error when commander loop is not running.        
+        """
+        event_loop = self._event_loop
+        if event_loop is None:
+            raise CommanderNotRunError(f"Commander is not running, commander: {self!r}.")
+        put_jobs_threadsafe_wrapper = self.CallHandlerThreadsafeWrapper(self._put_jobs_nowait, list(jobs))
+        with self._threadsafe_waiting_tasks_lock:
+            self._threadsafe_waiting_tasks.add(put_jobs_threadsafe_wrapper)
+            self._empty_event.clear()
+        event_loop.call_soon_threadsafe(self._wrap_call_handler, put_jobs_threadsafe_wrapper)
+
+    def _put_jobs_nowait(self, jobs: list[Job]) -> None:
+        for job in jobs:
+            self._put_job_nowait(job)
 
     def _call_handler(
         self,
@@ -625,6 +731,8 @@ class CommanderAsync(CommanderAsyncInterface[T]):
 
 
     class CallHandlerThreadsafeWrapper:
+        __slots__ = ("func", "args", "kwargs")
+
         def __init__(self, func, *args, **kwargs):
             self.func = func
             self.args = args
@@ -638,9 +746,12 @@ class CommanderAsync(CommanderAsyncInterface[T]):
         self,
         call_handler_threadsafe_wrapper: CallHandlerThreadsafeWrapper
     ) -> Task | None:
-        task = call_handler_threadsafe_wrapper.execute()
-        with self._threadsafe_waiting_tasks_lock:
-            self._threadsafe_waiting_tasks.discard(call_handler_threadsafe_wrapper)
+        try:
+            task = call_handler_threadsafe_wrapper.execute()
+        finally:
+            with self._threadsafe_waiting_tasks_lock:
+                self._threadsafe_waiting_tasks.discard(call_handler_threadsafe_wrapper)
+            self._refresh_empty_event()
         return task
 
     def call_handler_threadsafe(self, handler: HandlerCoroutine) -> None:
@@ -655,6 +766,7 @@ class CommanderAsync(CommanderAsyncInterface[T]):
         call_handler_threadsafe_wrapper = self.CallHandlerThreadsafeWrapper(self._call_handler, handler)
         with self._threadsafe_waiting_tasks_lock:
             self._threadsafe_waiting_tasks.add(call_handler_threadsafe_wrapper)
+            self._empty_event.clear()
         event_loop.call_soon_threadsafe(self._wrap_call_handler, call_handler_threadsafe_wrapper)
 
 def tasker(password):
@@ -680,10 +792,11 @@ def tasker(password):
         "self_job" refers to the job instance.
         """
         func.__tasker__ = True
+        is_coroutine_function = iscoroutinefunction(func)
         @wraps(func)
         async def wrap_function(self_job: Job):
             try:
-                if iscoroutinefunction(func):
+                if is_coroutine_function:
                     result = await func(self_job)
                 else:
                     result = func(self_job)
@@ -914,10 +1027,17 @@ def handler(password: str):
         if not iscoroutinefunction(coro_func):
             raise TypeError("Handler function must be a coroutine function.")
 
+        # The class of a method is not yet defined at decoration time,
+        # so whether the first parameter is bound is determined on the first call and then cached.
+        first_param_bound: bool | None = None
+
         @wraps(coro_func)
         def wrap_function(*args: P.args, **kwargs: P.kwargs) -> HandlerCoroutine[R]:
+            nonlocal first_param_bound
+            if first_param_bound is None:
+                first_param_bound = _is_first_param_bound(coro_func)
             handler_coroutine = HandlerCoroutine()
-            if _is_first_param_bound(coro_func):
+            if first_param_bound:
                 handler_coroutine._constructor = {
                     "coro_func": coro_func,
                     "args": (args[0], handler_coroutine, *args[1:]),
@@ -1110,6 +1230,9 @@ class Callback:
                 Allow the number of times the _task_node can be set. Once this allowance is exhausted,
                 the task_node will be automatically locked and unable to change unless unlocked.
                 If set to None, the auto-lock feature will not be enabled.
+
+        Raises:
+            TypeError: If task_node_auto_lock_num is neither an int nor None.
         """
         self.at_job_start = at_job_start or []
         self.at_handler_start = at_handler_start or []
@@ -1118,6 +1241,8 @@ class Callback:
         self.at_handler_end = at_handler_end or []
         self.at_job_end = at_job_end or []
         self.at_commander_end = at_commander_end or []
+        if task_node_auto_lock_num is not None and not isinstance(task_node_auto_lock_num, int):
+            raise TypeError(f"{task_node_auto_lock_num} is not int, parameter 'task_node_auto_lock_num' passed to Callback have to be int or None.")
         self.__task_node_auto_lock_num = task_node_auto_lock_num
         self._task_node_lock = False
         if task_node is None:
@@ -1143,8 +1268,6 @@ class Callback:
     def _task_node(self, value: TaskNode) -> None:
         # check whether need to autolock
         if self.__task_node_auto_lock_num is not None:
-            if not isinstance(self.__task_node_auto_lock_num, int):
-                raise TypeError(f"{self.__task_node_auto_lock_num} is not int, parameter 'task_node_auto_lock_num' passed to Callback have to be int or None.")
             if self.__task_node_auto_lock_num > 0:
                 self.__task_node_auto_lock_num -= 1
             else:
@@ -3,6 +3,23 @@ from typing import Any
 from ._commander import Job, HandlerCoroutine
 
 
+def _start_next_node(from_node: Job | HandlerCoroutine, to_node: Job | HandlerCoroutine) -> None:
+    # Synchronous on purpose, so that the callback dispatch calls it inline without creating
+    # a coroutine for every hop of the graph.
+    # This is important; it allows a completed node to be ready again so that it can run multiple times.
+    if to_node not in to_node.children:
+        to_node._children.append(to_node)
+    
+    if isinstance(to_node, Job):
+        from_node.commander._put_job_nowait(to_node, parent=from_node.commander)
+    elif isinstance(to_node, HandlerCoroutine):
+        # This is important; it allows a handler object (coroutine object) to run multiple times.
+        to_node.reusable = True
+        from_node.call_handler(to_node, parent=from_node.commander)
+    else:
+        assert False, "The connected node should be a Job or handler object."
+
+
 def add_edge(
     from_node: Job | HandlerCoroutine,
     to_node: Job | HandlerCoroutine,
@@ -17,20 +34,6 @@ def add_edge(
         to_node: The next node.
         data: Shared data, which allows each node to access data from this object.
     """
-    async def next_node(from_node: Job | HandlerCoroutine, to_node: Job | HandlerCoroutine) -> None:
-        # This is important; it allows a completed node to be ready again so that it can run multiple times.
-        if to_node not in to_node.children:
-            to_node._children.append(to_node)
-        
-        if isinstance(to_node, Job):
-            await from_node.put_job(to_node, parent=from_node.commander)
-        elif isinstance(to_node, HandlerCoroutine):
-            # This is important; it allows a handler object (coroutine object) to run multiple times.
-            to_node.reusable = True
-            from_node.call_handler(to_node, parent=from_node.commander)
-        else:
-            assert False, "The connected node should be a Job or handler object."
-    
     if isinstance(from_node, HandlerCoroutine):
         from_node.reusable = True
 
@@ -40,7 +43,7 @@ def add_edge(
     from_node.add_callback_functions(
         which="at_job_end" if isinstance(from_node, Job) else "at_handler_end",
         functions_info={
-            "function": next_node,
+            "function": _start_next_node,
             "params": {
                 "args": (from_node, to_node),
                 "kwargs": {},
@@ -65,7 +68,7 @@ def add_conditional_edge(
             previous node.
         data: Shared data, which allows each node to access data from this object.
     """
-    async def next_node(
+    def next_node(
         from_node: Job | HandlerCoroutine,
         map: dict[Any, Job | HandlerCoroutine],
     ) -> None:
@@ -74,21 +77,10 @@ def add_conditional_edge(
         if to_node is None:
             return
         
-        # This is important; it allows a completed node to be ready again so that it can run multiple times.
-        if to_node not in to_node.children:
-            to_node._children.append(to_node)
-        
         if data is not None:
             to_node.data = data
         
-        if isinstance(to_node, Job):
-            await from_node.put_job(to_node, parent=from_node.commander)
-        elif isinstance(to_node, HandlerCoroutine):
-            # This is important; it allows a handler object (coroutine object) to run multiple times.
-            to_node.reusable = True
-            from_node.call_handler(to_node, parent=from_node.commander)
-        else:
-            assert False, "The connected node should be a Job or handler object."
+        _start_next_node(from_node, to_node)
     
     if isinstance(from_node, HandlerCoroutine):
         from_node.reusable = True
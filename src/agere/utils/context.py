@@ -13,7 +13,9 @@ Classes:
 """
 
 
-from copy import deepcopy
+from bisect import bisect_right
+from copy import copy
+from itertools import accumulate, chain, islice
 from typing import Callable, Generic, Literal, TypedDict, overload, cast
 
 from ._context_model_base import ContextModelBase, ContextPiece
@@ -90,6 +92,7 @@ class Context(Generic[ContextPiece]):
         self.context_model = context_model
         self._context: list[ContextPiece] = []
         self._piece_token_list: list[int] = []
+        self._piece_token_prefix_sums: list[int] = [0]
         self.token_window: int | None = token_window
         self.max_sending_token_num: int | None = max_sending_token_num
         self._bead_content: BeadContent[ContextPiece] = {
@@ -114,7 +117,31 @@ class Context(Generic[ContextPiece]):
 
     @property
     def bead_content(self) -> BeadContent[ContextPiece]:
-        return deepcopy(self._bead_content)
+        """A copy of the bead contents.
+
+        Each piece is copied shallowly, so modifying the returned pieces does not affect the bead.
+        A piece that appears in several places is copied once and shared by them, as deepcopy does.
+        """
+        copies: dict[int, ContextPiece] = {}
+
+        def copy_pieces(pieces: list[ContextPiece]) -> list[ContextPiece]:
+            copied_pieces = []
+            for piece in pieces:
+                copied = copies.get(id(piece))
+                if copied is None:
+                    copied = copies[id(piece)] = copy(piece)
+                copied_pieces.append(copied)
+            return copied_pieces
+
+        bead_content = self._bead_content
+        return {
+            "START": copy_pieces(bead_content["START"]),
+            "FLOWING": copy_pieces(bead_content["FLOWING"]),
+            "FIXED": {
+                position: copy_pieces(pieces) for position, pieces in bead_content["FIXED"].items()
+            },
+            "END": copy_pieces(bead_content["END"]),
+        }
 
     def _bead_content_with_tools(
         self,
@@ -122,11 +149,18 @@ class Context(Generic[ContextPiece]):
         by_names: list[str | ToolKit] | None = None,
     ) -> BeadContent[ContextPiece]:
         """Get the bead content with the tools taken into consideration."""
-        bead_content_copy = deepcopy(self.bead_content)
-        bead_content_copy["FIXED"].setdefault(self.fixed_bead_position_for_tools, []).extend(
-            self._tools_bead(by_types=by_types, by_names=by_names)
+        position = self.fixed_bead_position_for_tools
+        fixed_content = dict(self._bead_content["FIXED"])
+        fixed_content[position] = fixed_content.get(position, []) + self._tools_bead(
+            by_types=by_types,
+            by_names=by_names,
         )
-        return bead_content_copy
+        return {
+            "START": self._bead_content["START"],
+            "FLOWING": self._bead_content["FLOWING"],
+            "FIXED": fixed_content,
+            "END": self._bead_content["END"],
+        }
     
     def _bead_lengths_with_tools(
         self,
@@ -134,16 +168,20 @@ class Context(Generic[ContextPiece]):
         by_names: list[str | ToolKit] | None = None,
     ) -> BeadLengthInfo:
         """Get the bead content with the tools taken into consideration."""
-        bead_lengths_copy = deepcopy(self.bead_lengths)
-        bead_lengths_copy["FIXED"].setdefault(self.fixed_bead_position_for_tools, []).extend(
-            [
-                self.token_counter(piece) for piece in self._tools_bead(
-                    by_types=by_types,
-                    by_names=by_names,
-                )
-            ]
-        )
-        return bead_lengths_copy
+        position = self.fixed_bead_position_for_tools
+        fixed_lengths = dict(self._bead_lengths["FIXED"])
+        fixed_lengths[position] = fixed_lengths.get(position, []) + [
+            self.token_counter(piece) for piece in self._tools_bead(
+                by_types=by_types,
+                by_names=by_names,
+            )
+        ]
+        return {
+            "START": self._bead_lengths["START"],
+            "FLOWING": self._bead_lengths["FLOWING"],
+            "FIXED": fixed_lengths,
+            "END": self._bead_lengths["END"],
+        }
 
     def _tools_bead(
         self,
@@ -160,6 +198,15 @@ class Context(Generic[ContextPiece]):
         """Used to calculate the token number of the given context piece."""
         return self.context_model.token_counter(piece)
 
+    def _recount_context(self) -> None:
+        """Count every piece of the context again.
+
+        The context list is handed out by the context property, so its pieces may have been
+        edited or removed in place.
+        """
+        self._piece_token_list = [self.token_counter(piece) for piece in self._context]
+        self._piece_token_prefix_sums = [0]
+
     def token_counter_modifier(self, piece_list: list[ContextPiece], total_token_num: int) -> int:
         """Used to adjust the total token number in a list.
 
@@ -214,8 +261,7 @@ class Context(Generic[ContextPiece]):
         Raises:
             ValueError: When which is 'FIXED' but fixed not specified.
         """
-        for bead in beads:
-            self.validate_piece_type(bead)
+        self._validate_piece_types(beads)
         if which == "FIXED":
             if fixed is None:
                 raise ValueError("'fixed' parameter must be specified when which is 'fixed'.")
@@ -243,11 +289,58 @@ class Context(Generic[ContextPiece]):
         Raises:
             ValueError: When which is 'FIXED' but fixed not specified.
         """
-        for bead in new_beads:
-            self.validate_piece_type(bead)
+        self._validate_piece_types(new_beads)
+        if which == "FIXED" and fixed is None:
+            raise ValueError("'fixed' parameter must be specified when which is 'fixed'.")
+        self._set_bead(new_beads, which=which, fixed=fixed)
+
+    def bead_bulk_update(
+        self,
+        updates: dict[
+            Literal["START", "FLOWING", "FIXED", "END"],
+            list[ContextPiece] | dict[int | str, list[ContextPiece]],
+        ],
+    ) -> None:
+        """Update the contents of several beads at once.
+
+        All the pieces are validated before any bead is changed, so either every update
+        is applied or none is.
+
+        Args:
+            updates:
+                Map the bead type to its new contents. 'START', 'FLOWING' and 'END' take a list
+                of pieces, 'FIXED' takes a dict from fixed bead positions to lists of pieces.
+                Fixed bead positions not in the dict are left unchanged.
+
+        Raises:
+            ValueError: When the contents for 'FIXED' is not a dict.
+        """
+        for which, new_beads in updates.items():
+            if which == "FIXED":
+                if not isinstance(new_beads, dict):
+                    raise ValueError("The contents for 'FIXED' must be a dict of fixed bead positions to pieces.")
+                for beads in new_beads.values():
+                    self._validate_piece_types(beads)
+            else:
+                self._validate_piece_types(cast(list[ContextPiece], new_beads))
+
+        for which, new_beads in updates.items():
+            if which == "FIXED":
+                new_beads = cast(dict[int | str, list[ContextPiece]], new_beads)
+                for fixed, beads in new_beads.items():
+                    self._set_bead(beads, which="FIXED", fixed=fixed)
+            else:
+                self._set_bead(cast(list[ContextPiece], new_beads), which=which)
+
+    def _set_bead(
+        self,
+        new_beads: list[ContextPiece],
+        which: Literal["START", "FLOWING", "FIXED", "END"],
+        fixed: int | str | None = None,
+    ) -> None:
+        """Replace the contents of a bead with pieces that have already been validated."""
         if which == "FIXED":
-            if fixed is None:
-                raise ValueError("'fixed' parameter must be specified when which is 'fixed'.")
+            assert fixed is not None
             self._bead_content["FIXED"][fixed] = new_beads
             self._bead_lengths["FIXED"][fixed] = [self.token_counter(piece) for piece in new_beads]
         else:
@@ -329,7 +422,13 @@ class Context(Generic[ContextPiece]):
 
     @property
     def bead_lengths(self) -> BeadLengthInfo:
-        return deepcopy(self._bead_lengths)
+        bead_lengths = self._bead_lengths
+        return {
+            "START": bead_lengths["START"][:],
+            "FLOWING": bead_lengths["FLOWING"][:],
+            "FIXED": {position: lengths[:] for position, lengths in bead_lengths["FIXED"].items()},
+            "END": bead_lengths["END"][:],
+        }
 
     @property
     def flowing_bead_position(self) -> int:
@@ -350,15 +449,30 @@ class Context(Generic[ContextPiece]):
 
     @property
     def fixed_bead_positions(self) -> list:
-        return list(self.bead_content["FIXED"].keys())
+        return list(self._bead_content["FIXED"].keys())
 
     @property
     def piece_token_list(self) -> list[int]:
         """Give the list of the token lengths for each piece in the context."""
         if len(self._piece_token_list) != len(self._context):
-            self._piece_token_list = [self.token_counter(piece) for piece in self._context]
+            self._recount_context()
         return self._piece_token_list
 
+    @property
+    def _piece_token_prefix(self) -> list[int]:
+        """The prefix sums of piece_token_list, extended lazily as the context grows."""
+        piece_token_list = self.piece_token_list
+        prefix_sums = self._piece_token_prefix_sums
+        known_num = len(prefix_sums) - 1
+        if known_num > len(piece_token_list):
+            prefix_sums = self._piece_token_prefix_sums = [0]
+            known_num = 0
+        running_sum = prefix_sums[-1]
+        for token_num in piece_token_list[known_num:]:
+            running_sum += token_num
+            prefix_sums.append(running_sum)
+        return prefix_sums
+
     def _get_fixed_bead_config_with_tool(
         self,
         fixed: list[int | str] | Literal["ALL"],
@@ -440,10 +554,28 @@ class Context(Generic[ContextPiece]):
                 by_types=tools_by_types,
                 by_names=tools_by_names,
             )
+
+        if not self.context_model.is_counter_modified:
+            # Without a modifier the total is a plain sum, so the content need not be assembled.
+            fixed = [] if "FIXED" not in bead else self.fixed_bead_positions if fixed == "ALL" else fixed
+            if tool_names_list and self._should_insert_tools_into_bead:
+                tool_names_list = cast(list[str | ToolKit], tool_names_list)
+                bead_lengths = self._bead_lengths_with_tools(by_types=[], by_names=tool_names_list)
+            else:
+                bead_lengths = self._bead_lengths
+            length = self._piece_token_prefix[-1] if context else 0
+            if "START" in bead:
+                length += sum(bead_lengths["START"])
+            if "FLOWING" in bead:
+                length += sum(bead_lengths["FLOWING"])
+            if "END" in bead:
+                length += sum(bead_lengths["END"])
+            length += sum(sum(bead_lengths["FIXED"][position]) for position in fixed)
+            return (length+tools_token_num) / max_sending_token_num
         
         if "START" in bead:
-            context_included.extend(self.bead_content["START"])
-            context_included_lenght_list.extend(self.bead_lengths["START"])
+            context_included.extend(self._bead_content["START"])
+            context_included_lenght_list.extend(self._bead_lengths["START"])
 
         fixed = [] if "FIXED" not in bead else self.fixed_bead_positions if fixed == "ALL" else fixed
         flowing_backward_index = (
@@ -469,8 +601,8 @@ class Context(Generic[ContextPiece]):
         context_included_lenght_list.extend(mid_content_length_list)
         
         if "END" in bead:
-            context_included.extend(self.bead_content["END"])
-            context_included_lenght_list.extend(self.bead_lengths["END"])
+            context_included.extend(self._bead_content["END"])
+            context_included_lenght_list.extend(self._bead_lengths["END"])
         length = self._token_num_from_piece_list(
             context_included,
             piece_token_list=context_included_lenght_list
@@ -515,8 +647,8 @@ class Context(Generic[ContextPiece]):
             bead_content_considering_tools = self._bead_content_with_tools(by_types=[], by_names=tool_names)
             bead_lengths_considering_tools = self._bead_lengths_with_tools(by_types=[], by_names=tool_names)
         else:
-            bead_content_considering_tools = self.bead_content
-            bead_lengths_considering_tools = self.bead_lengths
+            bead_content_considering_tools = self._bead_content
+            bead_lengths_considering_tools = self._bead_lengths
 
         fixed = self.fixed_bead_positions if fixed == "ALL" else fixed
 
@@ -627,7 +759,7 @@ class Context(Generic[ContextPiece]):
         if max_sending_token_num is None:
             result_inf = []
             if "START" in bead:
-                result_inf.extend(self.bead_content["START"])
+                result_inf.extend(self._bead_content["START"])
             
             flowing_backward_index = (
                 self.flowing_bead_position - len(self._context) - 1
@@ -655,7 +787,7 @@ class Context(Generic[ContextPiece]):
             )
 
             if "END" in bead:
-                result_inf.extend(self.bead_content["END"])
+                result_inf.extend(self._bead_content["END"])
             
             return result_inf
         
@@ -679,8 +811,8 @@ class Context(Generic[ContextPiece]):
             )
         else:
             tool_names_list = []
-            bead_content_considering_tools = self.bead_content
-            bead_lengths_considering_tools = self.bead_lengths
+            bead_content_considering_tools = self._bead_content
+            bead_lengths_considering_tools = self._bead_lengths
         
         if self.tools_manager is not None and self.tools_manager.tool_model_type != "CUSTOM":
             max_sending_token_num -= self.tools_manager.tools_manual_token_num(
@@ -698,47 +830,66 @@ class Context(Generic[ContextPiece]):
         remaining_length = max_sending_token_num - used_length
 
         if "FLOWING" in bead:
-            mid_content = (
-                self._context[:self.flowing_bead_position]
-                + bead_content_considering_tools["FLOWING"]
-                + self._context[self.flowing_bead_position:]
+            flowing_beads = bead_content_considering_tools["FLOWING"]
+            flowing_bead_position = self.flowing_bead_position
+            mid_content = list(
+                chain(
+                    islice(self._context, flowing_bead_position),
+                    flowing_beads,
+                    islice(self._context, flowing_bead_position, None),
+                )
             )
             trimmed_mid_content = self.trim_piece_list_by_token_num(mid_content, remaining_length)
             context_length = len(self._context)
-            valid_context_length = len(trimmed_mid_content) - len(bead_content_considering_tools["FLOWING"])
+            valid_context_length = len(trimmed_mid_content) - len(flowing_beads)
             if len(trimmed_mid_content) < (
-                context_length - self.flowing_bead_position + len(
-                    bead_content_considering_tools["FLOWING"]
-                )
+                context_length - flowing_bead_position + len(flowing_beads)
             ):
                 # The flowing bead should be shifted to the end.
                 remaining_length -= sum(bead_lengths_considering_tools["FLOWING"])
                 trimmed_messages = self.trim_piece_list_by_token_num(self._context, remaining_length)
-                trimmed_mid_content = trimmed_messages + bead_content_considering_tools["FLOWING"]
-                result.extend(trimmed_mid_content)
+                result.extend(trimmed_messages)
+                result.extend(flowing_beads)
                 self._flowing_bead_position = context_length
                 valid_context_length = len(trimmed_messages)
+                trimmed_mid_length = valid_context_length + len(flowing_beads)
                 flowing_backward_index = -1
             else:
                 result.extend(trimmed_mid_content)
+                trimmed_mid_length = len(trimmed_mid_content)
                 flowing_backward_index = (
-                    self.flowing_bead_position - context_length - 1
-                    if self.flowing_bead_position >= 0
-                    else self.flowing_bead_position
+                    flowing_bead_position - context_length - 1
+                    if flowing_bead_position >= 0
+                    else flowing_bead_position
                 )
         else:
             trimmed_mid_content = self.trim_piece_list_by_token_num(self._context, remaining_length)
             result.extend(trimmed_mid_content)
             valid_context_length = len(trimmed_mid_content)
+            trimmed_mid_length = valid_context_length
             flowing_backward_index = None
 
+        if self.context_model.is_counter_modified:
+            # The content is assembled again while fitting the modified token number,
+            # so there is no need to insert the fixed and end beads here.
+            tool_names_list = cast(list[str | ToolKit], tool_names_list)
+            return self._adjust_for_token_modifier(
+                valid_context_length=valid_context_length,
+                bead=bead,
+                fixed=fixed,
+                flowing_backward_index=flowing_backward_index,
+                tool_names=tool_names_list,
+                max_token_num=max_sending_token_num,
+                adjust_bead_position=True,
+            )
+
         if "FIXED" in bead:
             dynamic_fixed_info = [
                 {
                     "key": position,
                     "dynaic_position": self._get_dynamic_position(
                         position=position,
-                        length=len(trimmed_mid_content),
+                        length=trimmed_mid_length,
                     ),
                 } for position in fixed
             ]
@@ -759,19 +910,7 @@ class Context(Generic[ContextPiece]):
         if "END" in bead:
             result.extend(bead_content_considering_tools["END"])
 
-        if not self.context_model.is_counter_modified:
-            return result
-        else:
-            tool_names_list = cast(list[str | ToolKit], tool_names_list)
-            return self._adjust_for_token_modifier(
-                valid_context_length=valid_context_length,
-                bead=bead,
-                fixed=fixed,
-                flowing_backward_index=flowing_backward_index,
-                tool_names=tool_names_list,
-                max_token_num=max_sending_token_num,
-                adjust_bead_position=True,
-            )
+        return result
     
     def _adjust_for_token_modifier(
         self,
@@ -807,15 +946,15 @@ class Context(Generic[ContextPiece]):
         )
 
         if "START" in bead:
-            content.extend(self.bead_content["START"])
-            content_tokens_list.extend(self.bead_lengths["START"])
+            content.extend(self._bead_content["START"])
+            content_tokens_list.extend(self._bead_lengths["START"])
         
         content.extend(mid_content)
         content_tokens_list.extend(mid_content_tokens_list)
         
         if "END" in bead:
-            content.extend(self.bead_content["END"])
-            content_tokens_list.extend(self.bead_lengths["END"])
+            content.extend(self._bead_content["END"])
+            content_tokens_list.extend(self._bead_lengths["END"])
 
         token_num = self._token_num_from_piece_list(
             piece_list=content,
@@ -845,10 +984,8 @@ class Context(Generic[ContextPiece]):
     
     @property
     def token_num(self) -> int:
-        return self._token_num_from_piece_list(
-            self.context,
-            piece_token_list=self.piece_token_list
-        )
+        # The last prefix sum is the simple sum of piece_token_list, kept up to date incrementally.
+        return self.token_counter_modifier(self._context, self._piece_token_prefix[-1])
     
     def _token_num_from_piece_list(
         self,
@@ -868,6 +1005,13 @@ class Context(Generic[ContextPiece]):
             raise ContextPieceTypeError(f"The type of the context piece is incorrect. Piece: {piece!r}")
         return result
 
+    def _validate_piece_types(self, pieces: list[ContextPiece]) -> None:
+        """Check the type of every piece in the list."""
+        piece_type_validator = self.context_model.piece_type_validator
+        for piece in pieces:
+            if not piece_type_validator(piece):
+                raise ContextPieceTypeError(f"The type of the context piece is incorrect. Piece: {piece!r}")
+
     def context_append(
         self,
         piece: ContextPiece,
@@ -994,8 +1138,7 @@ class Context(Generic[ContextPiece]):
         if tools_by_types or tools_by_names:
             fixed, bead = self._get_fixed_bead_config_with_tool(fixed=fixed, bead=bead)
 
-        for piece in piece_list:
-            self.validate_piece_type(piece)
+        self._validate_piece_types(piece_list)
         if max_sending_token_num is None:
             self._context.extend(piece_list)
             self._piece_token_list.extend(self.token_counter(piece) for piece in piece_list)
@@ -1056,13 +1199,13 @@ class Context(Generic[ContextPiece]):
             is_lenght=True,
         )
         if "START" in bead:
-            minimal_context.extend(self.bead_content["START"])
-            minimal_context_token_list.extend(self.bead_lengths["START"])
+            minimal_context.extend(self._bead_content["START"])
+            minimal_context_token_list.extend(self._bead_lengths["START"])
         minimal_context.extend(mid_content)
         minimal_context_token_list.extend(mid_content_token_list)
         if "END" in bead:
-            minimal_context.extend(self.bead_content["END"])
-            minimal_context_token_list.extend(self.bead_lengths["START"])
+            minimal_context.extend(self._bead_content["END"])
+            minimal_context_token_list.extend(self._bead_lengths["START"])
 
         minimal_context_token_num = self._token_num_from_piece_list(
             minimal_context,
@@ -1072,15 +1215,37 @@ class Context(Generic[ContextPiece]):
 
     def context_update(self, context: list[ContextPiece]) -> None:
         """Update (rewrite) the content of context."""
-        for piece in context:
-            self.validate_piece_type(piece)
+        self._validate_piece_types(context)
         self._context = context
-        self._piece_token_list = [self.token_counter(piece) for piece in context]
+        self._recount_context()
 
     def shift_flowing_bead(self) -> None:
         """Move the flowing bead to the end of the context."""
         self._flowing_bead_position = len(self._context)
 
+    def reset(self) -> None:
+        """Clear the context and all the beads so that the context object can be reused.
+
+        The configuration, such as the context model, the token window, the max_sending_token_num
+        and the tools manager, is kept. The lists previously passed in or returned are not modified.
+        """
+        self._context = []
+        self._piece_token_list = []
+        self._piece_token_prefix_sums = [0]
+        self._bead_content = {
+            "START": [],
+            "FLOWING": [],
+            "FIXED": {},
+            "END": [],
+        }
+        self._flowing_bead_position = 0
+        self._bead_lengths = {
+            "START": [],
+            "FLOWING": [],
+            "FIXED": {},
+            "END": [],
+        }
+
     def trim_piece_list_by_token_num(
         self,
         piece_list: list[ContextPiece],
@@ -1097,15 +1262,21 @@ class Context(Generic[ContextPiece]):
         Returns:
             list: Truncated pieces list.
         """
-        if piece_list == self.context:
-            position = _find_position(self.piece_token_list, max_token_num)
+        if piece_list is self._context or piece_list == self._context:
+            piece_token_list = self.piece_token_list
+            position = _find_position(
+                piece_token_list,
+                max_token_num,
+                prefix_sum=self._piece_token_prefix,
+            )
         else:
-            position = _find_position([self.token_counter(piece) for piece in piece_list], max_token_num)
+            piece_token_list = [self.token_counter(piece) for piece in piece_list]
+            position = _find_position(piece_token_list, max_token_num)
         if modifier is True:
             return self._piece_list_modifier(
                 piece_list=piece_list[position:],
                 max_token_num=max_token_num,
-                piece_token_list=self._piece_token_list
+                piece_token_list=piece_token_list[position:]
             )
         else:
             return piece_list[position:]
@@ -1118,13 +1289,14 @@ class Context(Generic[ContextPiece]):
     ) -> list[ContextPiece]:
         if not self.context_model.is_counter_modified:
             return piece_list
-        for i in range(len(piece_list)):
-            total_tokens = self._token_num_from_piece_list(
-                piece_list=piece_list[i:],
-                piece_token_list = piece_token_list[i:] if piece_token_list is not None else None
-            )
-            if total_tokens <= max_token_num:
+        if piece_token_list is None or len(piece_token_list) != len(piece_list):
+            piece_token_list = [self.token_counter(piece) for piece in piece_list]
+        # Drop pieces from the front, keeping the simple sum of the rest up to date.
+        remaining_token_num = sum(piece_token_list)
+        for i, token_num in enumerate(piece_token_list):
+            if self.token_counter_modifier(piece_list[i:], remaining_token_num) <= max_token_num:
                 return piece_list[i:]
+            remaining_token_num -= token_num
         raise ContextTokenError("There is not enough token space.")
 
     def _get_dynamic_position(self, position: str | int, length: int) -> int:
@@ -1167,7 +1339,7 @@ class Context(Generic[ContextPiece]):
         return position
 
 
-def _find_position(lst, num):
+def _find_position(lst, num, prefix_sum=None):
     """
     Finds the farthest left position in the list where the sum of all elements
     after that position is less than the given number 'num'.
@@ -1177,23 +1349,16 @@ def _find_position(lst, num):
     Args:
         - lst {list}: The list of integers.
         - num {int}: The target number.
+        - prefix_sum {list | None}:
+            The prefix sums of lst, starting with 0. If it is None, it is built from lst.
     
     Returns:
         int: The 1-based index of the position found, (index + 1)
         return 0 if the sum of all integers is less than num,
         return the length of lst if the last integers is greater than num.
     """
-    prefix_sum = [0]
-    for x in lst:
-        prefix_sum.append(prefix_sum[-1] + x)
-
-    left, right = 0, len(prefix_sum) - 1
-
-    while left < right:
-        mid = (left + right) // 2
-        if prefix_sum[-1] - prefix_sum[mid] < num:
-            right = mid
-        else:
-            left = mid + 1
+    if prefix_sum is None:
+        prefix_sum = list(accumulate(lst, initial=0))
 
-    return left
+    # The first position whose suffix sum, prefix_sum[-1] - prefix_sum[i], is less than num.
+    return min(bisect_right(prefix_sum, prefix_sum[-1] - num), len(lst))
@@ -4,6 +4,8 @@ from .._context_model_base import ContextModelBase, ContextPiece
 
 
 class OpenaiContextModel(ContextModelBase, Generic[ContextPiece]):
+
+    _required_keys = frozenset({"role", "content"})
     
     def __init__(
         self,
@@ -54,8 +56,7 @@ class OpenaiContextModel(ContextModelBase, Generic[ContextPiece]):
     
     def piece_type_validator(self, context_piece: ContextPiece) -> bool:
         """Check if the context_piece is a valid openai message piece."""
-        required_keys = {'role', 'content'}
-        return isinstance(context_piece, dict) and required_keys <= context_piece.keys()
+        return isinstance(context_piece, dict) and self._required_keys.issubset(context_piece)
     
     @property
     def is_counter_modified(self) -> bool:
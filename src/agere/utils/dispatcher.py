@@ -34,16 +34,32 @@ async def async_dispatcher_tools_call_for_openai(
     logger = logger or get_null_logger()
     to_user_queue = asyncio.Queue()
     function_call_queue = asyncio.Queue()
+    role_queue_dict = {"to_user": to_user_queue, "tool_call": function_call_queue}
+    # Set when the source is exhausted. Generators that have not started consuming yet
+    # observe it directly, so the end marker only needs to be put on queues being consumed.
+    closed = asyncio.Event()
+    consuming_roles: set[str] = set()
+
+    def close_queues():
+        closed.set()
+        for role_name in consuming_roles:
+            role_queue_dict[role_name].put_nowait(None)
 
     async def splitter():
         buffer: str = ''
+        # Arguments received after the to_user content is complete are never searched,
+        # so they are collected as chunks and joined once.
+        after_to_user_chunks: list[str] = []
         tool_call_info: str = ''
         before_to_user_content: str = ''
         after_to_user_content: str = ''
         to_user_start_active: bool = False
         to_user_end_active: bool = False
         
+        to_user_key: str = f'"{to_user_flag}":'
         to_user_key_start: int = 0
+        # Where to resume searching for the to_user key, so that the buffer is not rescanned from the start.
+        to_user_key_search_start: int = 0
         to_user_content_start: int = 0
         find_to_user_content_start_position: int = 0
         tool_call_index_now: int = 0
@@ -86,24 +102,24 @@ async def async_dispatcher_tools_call_for_openai(
         
         async for chunk in source:
             chunk_choice = chunk.choices[0]
-            chunk_tool_calls = chunk_choice.delta.tool_calls
-            if chunk_choice.finish_reason == "tool_calls":
+            chunk_delta = chunk_choice.delta
+            chunk_tool_calls = chunk_delta.tool_calls
+            finish_reason = chunk_choice.finish_reason
+            if finish_reason == "tool_calls":
                 if to_user_end_active == to_user_start_active:
                     # Put the last function call.
-                    after_to_user_content = buffer
+                    after_to_user_content = buffer + "".join(after_to_user_chunks)
                     await put_a_function()
-                await to_user_queue.put(None)
-                await function_call_queue.put(None)
+                close_queues()
                 continue
-            if chunk_choice.finish_reason is not None:
-                await to_user_queue.put(None)
-                await function_call_queue.put(None)
+            if finish_reason is not None:
+                close_queues()
                 continue
 
             # Content is not None means no tools call, then put the "content" to user quequ and continue.
             # If no tools call, every chunk will be handle here.
             # Every chunk when no tools call.
-            content = chunk_choice.delta.content
+            content = chunk_delta.content
             if content is not None:
                 await to_user_queue.put(content)
                 continue
@@ -115,33 +131,36 @@ async def async_dispatcher_tools_call_for_openai(
                 continue
 
             chunk_tool_call = chunk_tool_calls[0]
+            chunk_function = chunk_tool_call.function
             # Get the name of the function called
             # Second chunk when call tools.
             if chunk_tool_call.type == 'function':
                 tool_call_index = chunk_tool_call.index
                 if tool_call_index_now != tool_call_index:
                     # The second and subsequent function calls.
-                    after_to_user_content = buffer
+                    after_to_user_content = buffer + "".join(after_to_user_chunks)
                     if to_user_end_active is True: # The content of 'to_user' exists and is complete.
                         # In cases where there is information for the user, messages from different functions are separated by a newline.
                         await to_user_queue.put("\n")
                     if to_user_end_active == to_user_start_active: # Exclude the case where the parameter parsing is incomplete.
                         await put_a_function()
                     buffer = ''
+                    after_to_user_chunks.clear()
+                    to_user_key_search_start = 0
                     to_user_start_active = False
                     to_user_end_active = False
-                function_name = chunk_tool_call.function.name
+                function_name = chunk_function.name
                 tool_call_info = f'{{"tool_call_index": {chunk_tool_call.index}, "tool_call_id": "{chunk_tool_call.id}", "name": "{function_name}", "arguments": '
                 tool_call_index_now = tool_call_index
                 continue
 
             # Split the message to user and the function call arguments
-            arguments = chunk_tool_call.function.arguments
-            buffer += arguments
-            
+            arguments = chunk_function.arguments
             if to_user_end_active:
                 # After to_user content
+                after_to_user_chunks.append(arguments)
                 continue
+            buffer += arguments
 
             if to_user_start_active is True:
                 # In 'to_user' param:
@@ -149,11 +168,19 @@ async def async_dispatcher_tools_call_for_openai(
                 if to_user_content_end != -1 and buffer[to_user_content_end - 1] != '\\':
                     to_user_end_active = True
                 await do_check_to_user_end()
+                if not to_user_end_active:
+                    # Everything before to_user_content_start has been sent to the user, drop it so that
+                    # the buffer does not grow with the whole to_user content. Keep the last sent
+                    # character, it is needed to check whether the next quote is escaped.
+                    buffer = buffer[to_user_content_start:]
+                    to_user_content_start = 0
                 continue
 
             # Before to_user start flag is found.
-            to_user_key_start = buffer.find(f'"{to_user_flag}":')
+            to_user_key_start = buffer.find(to_user_key, to_user_key_search_start)
             if to_user_key_start == -1:
+                # The key may be split across chunks, so keep its possible beginning in the next search.
+                to_user_key_search_start = max(len(buffer) - len(to_user_key) + 1, 0)
                 continue # Do not find the "to_user" key, continue to receive the next chunk.
             # In 'to_user' param:
             before_to_user_content = buffer[:to_user_key_start]
@@ -179,12 +206,14 @@ async def async_dispatcher_tools_call_for_openai(
                 # where the string content of the 'to_user' is not immediately followed after '"to_user":'
                 find_to_user_content_start_position = to_user_content_start  # pragma: no cover
 
-    role_queue_dict = {"to_user": to_user_queue, "tool_call": function_call_queue}
-    
     def make_generator(role_name: str):
         async def generator():
+            queue = role_queue_dict[role_name]
+            consuming_roles.add(role_name)
             while True:
-                value = await role_queue_dict[role_name].get()
+                if closed.is_set() and queue.empty():
+                    break
+                value = await queue.get()
                 if value is None: # End of the queue
                     break
                 yield value
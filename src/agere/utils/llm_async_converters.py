@@ -53,17 +53,15 @@ class LLMAsyncAdapter:
             function = callback["function"]
             params = callback.get("params")
             if params is None:
-                if iscoroutinefunction(function):
-                    await function()
-                else:
-                    function()
+                args = ()
+                kwargs = {}
             else:
                 args = params.get("args", ())
                 kwargs = params.get("kwargs", {})
-                if iscoroutinefunction(function):
-                    await function(*args, **kwargs)
-                else:
-                    function(*args, **kwargs)
+            if iscoroutinefunction(function):
+                await function(*args, **kwargs)
+            else:
+                function(*args, **kwargs)
 
     async def llm_to_async_iterable(
         self,
@@ -78,9 +76,14 @@ class LLMAsyncAdapter:
             self._at_receiving_end = at_receiving_end
         self.received_message = []
         is_first_time = True
+        # An in-memory sequence never blocks, so its chunks are not fetched in a worker thread.
+        is_in_memory = isinstance(response, (list, tuple))
         response_iter = iter(response)
         while True:
-            chunk = await asyncio.to_thread(next, response_iter, None)
+            if is_in_memory:
+                chunk = next(response_iter, None)
+            else:
+                chunk = await asyncio.to_thread(next, response_iter, None)
             if is_first_time is True:
                 await self.at_receiving_start()
                 is_first_time = False
@@ -30,6 +30,9 @@ from typing import Self
 from ._exceptions import AgereUtilsError
 
 
+_VARIABLE_PATTERN = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
 class PromptTemplateError(AgereUtilsError):
     """Raised when encountering an error related to the prompt template."""
 
@@ -71,6 +74,9 @@ class PromptTemplate:
             prompt_template (str): The initial template string with placeholders.
         """
         self.prompt_template = prompt_template
+        # The unfilled variables found in _scanned_template, reused until prompt_template changes.
+        self._scanned_template: str | None = None
+        self._unfilled_variables: list[str] = []
 
     @classmethod
     def load_template(cls, prompt_template: str) -> PromptTemplate:
@@ -103,6 +109,9 @@ class PromptTemplate:
             template = PromptTemplate("Hello, {{ name }}! Today is {{ day }}.")
             template.render(name="Alice").render(day="Wednesday")
         """
+        if variables.keys().isdisjoint(self._find_unfilled_variables()):
+            # None of the variables appears in the template, so rendering would not change it.
+            return self
         prompt_template = render_prompt(self.prompt_template, **variables)
         self.prompt_template = prompt_template
         return self
@@ -129,7 +138,7 @@ class PromptTemplate:
         Returns:
             list: The list of unfilled variable names.
         """
-        return find_unfilled_variables(self.prompt_template)
+        return self._find_unfilled_variables()[:]
 
     def is_fully_filled(self) -> bool:
         """
@@ -138,7 +147,15 @@ class PromptTemplate:
         Returns:
             bool: True if no placeholders remain unfilled, False otherwise.
         """
-        return is_prompt_fully_filled(self.prompt_template)
+        return not self._find_unfilled_variables()
+
+    def _find_unfilled_variables(self) -> list[str]:
+        """Find the unfilled variables, scanning the template only when it has changed since the last scan."""
+        prompt_template = self.prompt_template
+        if prompt_template is not self._scanned_template:
+            self._unfilled_variables = find_unfilled_variables(prompt_template)
+            self._scanned_template = prompt_template
+        return self._unfilled_variables
 
     def __str__(self) -> str:
         """
@@ -164,13 +181,11 @@ def render_prompt(prompt_template: str, **variables) -> str:
     Returns:
         str: The template string with placeholders replaced by actual values.
     """
-    pattern = re.compile(r"\{\{\s*(\w+)\s*\}\}")
-
     def replace_func(match):
         key = match.group(1)
         return str(variables.get(key, match.group(0)))
 
-    prompt = pattern.sub(replace_func, prompt_template)
+    prompt = _VARIABLE_PATTERN.sub(replace_func, prompt_template)
 
     return prompt
     
@@ -184,9 +199,8 @@ def is_prompt_fully_filled(prompt: str) -> bool:
     Returns:
         bool: True if no unfilled placeholders are found, False otherwise.
     """
-    if find_unfilled_variables(prompt):
-        return False
-    return True
+    # A plain substring check is much cheaper than the regex, and most rendered prompts have no braces left.
+    return "{{" not in prompt or _VARIABLE_PATTERN.search(prompt) is None
 
 def find_unfilled_variables(prompt_template: str) -> list[str]:
     """
@@ -198,7 +212,8 @@ def find_unfilled_variables(prompt_template: str) -> list[str]:
     Returns:
         list: The list of unfilled variable names.
     """
-    pattern = re.compile(r"\{\{\s*(\w+)\s*\}\}")
-    unfilled_variables = pattern.findall(prompt_template)
+    if "{{" not in prompt_template:
+        return []
+    unfilled_variables = _VARIABLE_PATTERN.findall(prompt_template)
     
     return unfilled_variables
@@ -1,13 +1,70 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, patch
 
 from agere.addons.qdrant_vector import AsyncQdrantVector, models
 
 
-@pytest.fixture
+VECTORS_CONFIG_100 = models.VectorParams(size=100, distance=models.Distance.COSINE)
+VECTORS_CONFIG_200 = models.VectorParams(size=200, distance=models.Distance.COSINE)
+
+def _payload_names(records: list[models.Record]) -> set[str]:
+    return {record.payload["name"] for record in records if record.payload is not None}
+
+@pytest.fixture(scope="module")
 def async_qdrant_client() -> AsyncQdrantVector:
     return AsyncQdrantVector(position=":memory:", position_type="memory")
 
+@pytest.fixture(autouse=True)
+async def clean_async_qdrant_client(async_qdrant_client: AsyncQdrantVector):
+    yield
+    for collection_name in await async_qdrant_client.get_all_collections():
+        await async_qdrant_client.delete_collection(collection_name)
+    async_qdrant_client.text_splitter = None
+
+@pytest.fixture(scope="module")
+def metadata_filters(async_qdrant_client: AsyncQdrantVector) -> dict[str, models.Filter]:
+    return {
+        "horse_or_city": async_qdrant_client.metadata_filter(
+            names=['horse', 'city'],
+        ),
+        "cat_1": async_qdrant_client.metadata_filter(
+            categories=['cat_1'],
+        ),
+        "cat_1_test": async_qdrant_client.metadata_filter(
+            categories=['cat_1'],
+            kinds=['test'],
+        ),
+        "test_in_time_range": async_qdrant_client.metadata_filter(
+            kinds=['test'],
+            created_datetime_range=("2024-05-18T12:00:00Z", "2024-05-18T17:30:00Z"),  # type: ignore
+            updated_datetime_range=("2024-05-18T14:00:00Z", "2024-05-18T16:30:00Z"),  # type: ignore
+        ),
+        "test_in_time_range_with_is": async_qdrant_client.metadata_filter(
+            kinds=['test'],
+            created_datetime_range=("2024-05-18T12:00:00Z", "2024-05-18T17:30:00Z"),  # type: ignore
+            updated_datetime_range=("2024-05-18T14:00:00Z", "2024-05-18T16:30:00Z"),  # type: ignore
+            document_texts=['is'],
+        ),
+        "all_conditions_with_ap": async_qdrant_client.metadata_filter(
+            names=['horse', 'city'],
+            categories=['cat_1', 'cat_2'],
+            kinds=['test'],
+            created_datetime_range=("2024-05-18T12:00:00Z", "2024-05-18T18:30:00Z"),  # type: ignore
+            updated_datetime_range=("2024-05-18T16:00:00Z", "2024-05-18T18:30:00Z"),  # type: ignore
+            document_texts=['ap'],
+        ),
+    }
+
+@pytest.fixture
+def no_fastembed():
+    """Make sure the tests that do not embed anything never load a fastembed model."""
+    with (
+        patch("agere.addons.qdrant_vector.AsyncQdrantClient._get_or_init_model") as mock_init_model,
+        patch("agere.addons.qdrant_vector.AsyncQdrantClient.set_model"),
+    ):
+        yield mock_init_model
+
 def test_set_embedding_model(async_qdrant_client: AsyncQdrantVector):
     # Action
     with patch("agere.addons.qdrant_vector.AsyncQdrantClient.set_model") as mock_set_model:
@@ -16,6 +73,7 @@ def test_set_embedding_model(async_qdrant_client: AsyncQdrantVector):
     # Assert
     mock_set_model.assert_called_with("model")
 
+@pytest.mark.usefixtures("no_fastembed")
 async def test_create_collection(async_qdrant_client: AsyncQdrantVector):
     # Action
     await async_qdrant_client.create_collection("test_collection")
@@ -24,13 +82,16 @@ async def test_create_collection(async_qdrant_client: AsyncQdrantVector):
     # Assert
     assert  all_collections == ["test_collection"]
 
-def test_default_vector_size(async_qdrant_client: AsyncQdrantVector):
+def test_default_vector_size(async_qdrant_client: AsyncQdrantVector, no_fastembed: Mock):
     # Action
     size = async_qdrant_client.default_vector_size
     
     # Assert
     assert isinstance(size, int)
+    # The size is looked up from the supported models table, the model itself is never loaded.
+    no_fastembed.assert_not_called()
 
+@pytest.mark.usefixtures("no_fastembed")
 def test_split(async_qdrant_client: AsyncQdrantVector):
     # Setup
     text_example = "This is a text example."
@@ -50,14 +111,12 @@ def test_split(async_qdrant_client: AsyncQdrantVector):
     # Assert
     text_splitter.split.assert_called_with(text_example)
 
+@pytest.mark.usefixtures("no_fastembed")
 async def test_recreate_collection(async_qdrant_client: AsyncQdrantVector):
     # Setup
     await async_qdrant_client.create_collection(
         "test_collection",
-        vectors_config=models.VectorParams(
-            size=100,
-            distance=models.Distance.COSINE,
-        ),
+        vectors_config=VECTORS_CONFIG_100,
     )
 
     # Assert
@@ -67,16 +126,14 @@ async def test_recreate_collection(async_qdrant_client: AsyncQdrantVector):
     # Action
     await async_qdrant_client.recreate_collection(
         "test_collection",
-        vectors_config=models.VectorParams(
-            size=200,
-            distance=models.Distance.COSINE,
-        ),
+        vectors_config=VECTORS_CONFIG_200,
     )
     
     # Assert
     info = await async_qdrant_client.get_collection("test_collection")
     assert info.config.params.vectors.size == 200  # type: ignore
     
+@pytest.mark.usefixtures("no_fastembed")
 async def test_delete_collection(async_qdrant_client: AsyncQdrantVector):
     # Action
     await async_qdrant_client.create_collection("test_collection")
@@ -92,6 +149,7 @@ async def test_delete_collection(async_qdrant_client: AsyncQdrantVector):
     # Assert
     assert  all_collections== []
 
+@pytest.mark.usefixtures("no_fastembed")
 async def test_update_collection(async_qdrant_client: AsyncQdrantVector):
     # Action
     with patch("agere.addons.qdrant_vector.AsyncQdrantClient.update_collection") as mock_update_collection:
@@ -100,104 +158,98 @@ async def test_update_collection(async_qdrant_client: AsyncQdrantVector):
     # Assert
     mock_update_collection.assert_called_with(collection_name="test_collection", vectors_config=None)
 
+@pytest.mark.usefixtures("no_fastembed")
 async def test_get_all_collection(async_qdrant_client: AsyncQdrantVector):
     # Action
-    await async_qdrant_client.create_collection("test_collection_1")
-    await async_qdrant_client.create_collection("test_collection_2")
+    await asyncio.gather(
+        async_qdrant_client.create_collection("test_collection_1"),
+        async_qdrant_client.create_collection("test_collection_2"),
+    )
     all_collections = await async_qdrant_client.get_all_collections()
     
     # Assert
     assert  set(all_collections) == {"test_collection_1", "test_collection_2"}
 
+@pytest.mark.usefixtures("no_fastembed")
 async def test_dose_collection_exist(async_qdrant_client: AsyncQdrantVector):
     # Setup
     await async_qdrant_client.create_collection("test_collection")
 
     # Action
-    yes = await async_qdrant_client.does_collection_exist("test_collection")
-    no = await async_qdrant_client.does_collection_exist("test_collection_1")
+    yes, no = await asyncio.gather(
+        async_qdrant_client.does_collection_exist("test_collection"),
+        async_qdrant_client.does_collection_exist("test_collection_1"),
+    )
 
     # Assert
     assert yes is True
     assert no is False
 
+@pytest.mark.usefixtures("no_fastembed")
 async def test_get_collection_info(async_qdrant_client: AsyncQdrantVector):
     # Action
     await async_qdrant_client.create_collection(
         "test_collection",
-        vectors_config=models.VectorParams(
-            size=100,
-            distance=models.Distance.COSINE,
-        ),
+        vectors_config=VECTORS_CONFIG_100,
     )
     info = await async_qdrant_client.get_collection_info("test_collection")
 
     # Assert
     assert info.config.params.vectors.size == 100  # type: ignore
 
-async def test_add_and_count(async_qdrant_client: AsyncQdrantVector):
-    # Setup
-    await async_qdrant_client.create_collection(collection_name="test_collection")
-    documents = [
+@pytest.fixture(scope="module")
+def documents() -> list[str]:
+    return [
         "Thomas's horse is green.",
         "Thomas has a red apple.",
+        "Beijing is the captial of China.",
     ]
 
-    # Action
-    await async_qdrant_client.add(
-        collection_name="test_collection",
-        documents=documents,
-    )
-
-    # Assert
-    count = await async_qdrant_client.count("test_collection")
-    assert count == 2
-    
-async def test_query(async_qdrant_client: AsyncQdrantVector):
-    # Setup
+@pytest.fixture
+async def populated_async_qdrant_client(
+    async_qdrant_client: AsyncQdrantVector,
+    documents: list[str],
+) -> AsyncQdrantVector:
+    create_time = ["2024-05-18T15:12:00Z"] * 3
     await async_qdrant_client.create_collection(collection_name="test_collection")
-    documents = [
-        "Thomas's horse is green.",
-        "Thomas has a red apple.",
-    ]
-    names = [
-        "horse",
-        "apple",
-    ]
-    kinds = ["test", "test"]
-    create_time = [
-        "2024-05-18T15:12:00Z",
-        "2024-05-18T15:12:00Z",
-    ]
     await async_qdrant_client.add(
         collection_name="test_collection",
         documents=documents,
-        names=names,
-        kinds=kinds,
+        names=["horse", "apple", "city"],
+        categories=["cat_1", "cat_1", "cat_2"],
+        kinds=["test", "test", "test"],
         created_datetimes=create_time,  # type: ignore
         updated_datetimes=create_time,  # type: ignore
     )
+    return async_qdrant_client
 
+async def test_add_and_count(populated_async_qdrant_client: AsyncQdrantVector):
     # Action
-    result = await async_qdrant_client.query(
-        collection_name="test_collection",
-        query_text="What the color is thomas's horse?",
-    )
+    count = await populated_async_qdrant_client.count("test_collection")
 
     # Assert
-    assert result == documents
+    assert count == 3
     
+async def test_query(
+    populated_async_qdrant_client: AsyncQdrantVector,
+    documents: list[str],
+    metadata_filters: dict[str, models.Filter],
+):
     # Action
-    result = await async_qdrant_client.query(
+    result = await populated_async_qdrant_client.query_batch(
         collection_name="test_collection",
-        query_text="Thomas has something red, do you know what it is?",
+        query_texts=[
+            "What the color is thomas's horse?",
+            "Thomas has something red, do you know what it is?",
+        ],
+        query_filter=metadata_filters["cat_1"],
     )
 
     # Assert
-    assert result == documents[::-1]
+    assert result == [documents[:2], documents[1::-1]]
     
     # Action
-    result = await async_qdrant_client.query(
+    result = await populated_async_qdrant_client.query(
         collection_name="test_collection",
         query_text="What the color is thomas's horse?",
         limit=1,
@@ -206,48 +258,15 @@ async def test_query(async_qdrant_client: AsyncQdrantVector):
     assert result[0].metadata == {  # type: ignore
         'document': "Thomas's horse is green.",
         'name': 'horse',
-        'category': None,
+        'category': 'cat_1',
         'kind': 'test',
         'created_datetime': '2024-05-18T15:12:00Z',
         'updated_datetime': '2024-05-18T15:12:00Z',
     }
 
-async def test_query_batch(async_qdrant_client: AsyncQdrantVector):
-    # Setup
-    await async_qdrant_client.create_collection(collection_name="test_collection")
-    documents = [
-        "Thomas's horse is green.",
-        "Thomas has a red apple.",
-        "Beijing is the captial of China."
-    ]
-    names = [
-        "horse",
-        "apple",
-        "city",
-    ]
-    categories = [
-        "cat_1",
-        "cat_1",
-        "cat_2"
-    ]
-    kinds = ["test", "test", "test"]
-    create_time = [
-        "2024-05-18T15:12:00Z",
-        "2024-05-18T15:12:00Z",
-        "2024-05-18T15:12:00Z",
-    ]
-    await async_qdrant_client.add(
-        collection_name="test_collection",
-        documents=documents,
-        names=names,
-        categories=categories,
-        kinds=kinds,
-        created_datetimes=create_time,  # type: ignore
-        updated_datetimes=create_time,  # type: ignore
-    )
-
+async def test_query_batch(populated_async_qdrant_client: AsyncQdrantVector):
     # Action
-    result = await async_qdrant_client.query_batch(
+    result = await populated_async_qdrant_client.query_batch(
         collection_name="test_collection",
         query_texts=[
             "What the color is thomas's horse?",
@@ -263,7 +282,7 @@ async def test_query_batch(async_qdrant_client: AsyncQdrantVector):
     ]
     
     # Action
-    result = await async_qdrant_client.query_batch(
+    result = await populated_async_qdrant_client.query_batch(
         collection_name="test_collection",
         query_texts=[
             "What the color is thomas's horse?",
@@ -283,7 +302,10 @@ async def test_query_batch(async_qdrant_client: AsyncQdrantVector):
         'updated_datetime': '2024-05-18T15:12:00Z',
     }
 
-async def test_scroll(async_qdrant_client: AsyncQdrantVector):
+async def test_scroll(
+    async_qdrant_client: AsyncQdrantVector,
+    metadata_filters: dict[str, models.Filter],
+):
     # Setup
     documents = [
         "Thomas's horse is green.",
@@ -316,86 +338,42 @@ async def test_scroll(async_qdrant_client: AsyncQdrantVector):
         updated_datetimes=create_time,  # type: ignore
     )
 
-    # Action
-    result = await async_qdrant_client.scroll(
-        collection_name="test_collection",
-    )
+    scroll_filters = [
+        None,
+        metadata_filters["horse_or_city"],
+        metadata_filters["cat_1_test"],
+        metadata_filters["test_in_time_range"],
+        metadata_filters["test_in_time_range_with_is"],
+        metadata_filters["all_conditions_with_ap"],
+    ]
 
-    # Assert
-    assert len(result[0]) == 3
-    
     # Action
-    result = await async_qdrant_client.scroll(
-        collection_name="test_collection",
-        scroll_filter=async_qdrant_client.metadata_filter(
-            names=['horse', 'city'],
+    results = await asyncio.gather(
+        *(
+            async_qdrant_client.scroll(
+                collection_name="test_collection",
+                scroll_filter=scroll_filter,
+            ) for scroll_filter in scroll_filters
         )
     )
-    names = {record.payload["name"] for record in result[0] if record.payload is not None}
 
     # Assert
-    assert names == {'horse', 'city'}
-    
-    # Action
-    result = await async_qdrant_client.scroll(
-        collection_name="test_collection",
-        scroll_filter=async_qdrant_client.metadata_filter(
-            categories=['cat_1'],
-            kinds=['test'],
-        )
-    )
-    names = {record.payload["name"] for record in result[0] if record.payload is not None}
-    
-    # Assert
-    assert names == {'horse', 'apple'}
-    
-    # Action
-    result = await async_qdrant_client.scroll(
-        collection_name="test_collection",
-        scroll_filter=async_qdrant_client.metadata_filter(
-            kinds=['test'],
-            created_datetime_range=("2024-05-18T12:00:00Z", "2024-05-18T17:30:00Z"),  # type: ignore
-            updated_datetime_range=("2024-05-18T14:00:00Z", "2024-05-18T16:30:00Z"),  # type: ignore
-        )
-    )
-    names = {record.payload["name"] for record in result[0] if record.payload is not None}
-    
-    # Assert
-    assert names == {'horse', 'apple'}
-    
-    # Action
-    result = await async_qdrant_client.scroll(
-        collection_name="test_collection",
-        scroll_filter=async_qdrant_client.metadata_filter(
-            kinds=['test'],
-            created_datetime_range=("2024-05-18T12:00:00Z", "2024-05-18T17:30:00Z"),  # type: ignore
-            updated_datetime_range=("2024-05-18T14:00:00Z", "2024-05-18T16:30:00Z"),  # type: ignore
-            document_texts=['is'],
-        ),
-    )
-    names = {record.payload["name"] for record in result[0] if record.payload is not None}
-    
-    # Assert
-    assert names == {'horse'}
-    
-    # Action
-    result = await async_qdrant_client.scroll(
-        collection_name="test_collection",
-        scroll_filter=async_qdrant_client.metadata_filter(
-            names=['horse', 'city'],
-            categories=['cat_1', 'cat_2'],
-            kinds=['test'],
-            created_datetime_range=("2024-05-18T12:00:00Z", "2024-05-18T18:30:00Z"),  # type: ignore
-            updated_datetime_range=("2024-05-18T16:00:00Z", "2024-05-18T18:30:00Z"),  # type: ignore
-            document_texts=['ap'],
-        ),
-    )
-    names = {record.payload["name"] for record in result[0] if record.payload is not None}
-    
-    # Assert
-    assert names == {'city'}
-
-async def test_delete(async_qdrant_client: AsyncQdrantVector):
+    assert len(results[0][0]) == 3
+    expected_names = [
+        {'horse', 'city'},
+        {'horse', 'apple'},
+        {'horse', 'apple'},
+        {'horse'},
+        {'city'},
+    ]
+    for result, expected in zip(results[1:], expected_names):
+        assert len(result[0]) == len(expected)
+        assert _payload_names(result[0]) == expected
+
+async def test_delete(
+    async_qdrant_client: AsyncQdrantVector,
+    metadata_filters: dict[str, models.Filter],
+):
     # Setup
     documents = [
         "Thomas's horse is green.",
@@ -435,9 +413,7 @@ async def test_delete(async_qdrant_client: AsyncQdrantVector):
     # Action
     await async_qdrant_client.delete(
         collection_name="test_collection",
-        filter=async_qdrant_client.metadata_filter(
-            categories=["cat_1"]
-        ),
+        filter=metadata_filters["cat_1"],
     )
 
     # Assert
@@ -447,9 +423,7 @@ async def test_delete(async_qdrant_client: AsyncQdrantVector):
     # Action
     await async_qdrant_client.delete(
         collection_name="test_collection",
-        filter=async_qdrant_client.metadata_filter(
-            names=["horse", "city"]
-        ),
+        filter=metadata_filters["horse_or_city"],
     )
     
     # Assert
@@ -0,0 +1,37 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from agere.commander import CommanderAsync
+
+
+@pytest.fixture(scope="module")
+def run_executor():
+    # One worker thread hosts the commander loops of the whole test module.
+    executor = ThreadPoolExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture(scope="module")
+def shared_commander():
+    # One commander per test module, it is stopped and reset after each test instead of being rebuilt.
+    _commander = CommanderAsync()
+    yield _commander
+    _commander.exit()
+
+
+@pytest.fixture
+def commander(shared_commander: CommanderAsync):
+    yield shared_commander
+    shared_commander.exit()
+    shared_commander.reset()
+
+
+@pytest.fixture
+def running_commander(commander, run_executor: ThreadPoolExecutor):
+    # The commander fixture of the test module, with its loop running on the worker thread.
+    run_future = run_executor.submit(commander.run)
+    assert commander.wait_until_running(timeout=5)
+    yield commander
+    commander.exit()
+    run_future.result(timeout=5)
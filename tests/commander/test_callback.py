@@ -1,7 +1,14 @@
 import pytest
+from unittest.mock import Mock
 
-from agere.commander import Callback
-from agere.commander._commander import TaskNode
+from agere.commander import CallbackDict, Callback, Job, tasker, PASS_WORD
+from agere.commander._commander import CallbackType, HandlerCoroutine, TaskNode
+
+
+class JobExample(Job):
+    @tasker(PASS_WORD)
+    async def task(self):
+        pass
 
 
 @pytest.fixture
@@ -9,39 +16,34 @@ def callback():
     return Callback()
 
 
+@pytest.fixture
+def function_info() -> CallbackDict:
+    return {"function": Mock()}
+
+
+@pytest.fixture(
+    params=[(HandlerCoroutine, "at_handler_start"), (JobExample, "at_job_start")],
+    ids=["handler", "job"],
+)
+def node_and_which(request) -> tuple[HandlerCoroutine | Job, CallbackType]:
+    node_class, which = request.param
+    return node_class(), which
+
+
 def test_task_node_setter():
     # Setup
-    tasknode_1 = TaskNode()
-    tasknode_2 = TaskNode()
-    tasknode_3 = TaskNode()
-    tasknode_4 = TaskNode()
-    tasknode_5 = TaskNode()
-    tasknode_1.id = "1"
-    tasknode_2.id = "2"
-    tasknode_3.id = "3"
-    tasknode_4.id = "4"
-    tasknode_5.id = "5"
+    tasknodes = [TaskNode() for _ in range(5)]
+    for i, tasknode in enumerate(tasknodes, 1):
+        tasknode.id = str(i)
 
     callback_1 = Callback()
     callback_2 = Callback(task_node_auto_lock_num=3)
     callback_3 = Callback(task_node=TaskNode(), task_node_auto_lock_num=3)
 
     # Action
-    callback_1._task_node = tasknode_1
-    callback_1._task_node = tasknode_2
-    callback_1._task_node = tasknode_3
-    callback_1._task_node = tasknode_4
-    callback_1._task_node = tasknode_5
-    callback_2._task_node = tasknode_1
-    callback_2._task_node = tasknode_2
-    callback_2._task_node = tasknode_3
-    callback_2._task_node = tasknode_4
-    callback_2._task_node = tasknode_5
-    callback_3._task_node = tasknode_1
-    callback_3._task_node = tasknode_2
-    callback_3._task_node = tasknode_3
-    callback_3._task_node = tasknode_4
-    callback_3._task_node = tasknode_5
+    for callback in (callback_1, callback_2, callback_3):
+        for tasknode in tasknodes:
+            callback._task_node = tasknode
 
     # Assert
     assert callback_1.task_node is not None
@@ -50,3 +52,37 @@ def test_task_node_setter():
     assert callback_2.task_node.id == "3"
     assert callback_3.task_node is not None
     assert callback_3.task_node.id == "2"
+
+def test_task_node_auto_lock_num_type():
+    # Assert
+    with pytest.raises(TypeError):
+        Callback(task_node_auto_lock_num="3")  # type: ignore
+
+
+def test_add_callback_functions(node_and_which: tuple[HandlerCoroutine | Job, CallbackType], function_info: CallbackDict):
+    # Setup
+    node, which = node_and_which
+
+    # Action
+    node.add_callback_functions(functions_info=function_info, which=which)
+    node.add_callback_functions(functions_info=[function_info, function_info], which=which)
+
+    # Assert
+    assert node.callback is not None
+    assert getattr(node.callback, which) == [function_info, function_info, function_info]
+    with pytest.raises(ValueError):
+        node.add_callback_functions(functions_info=function_info, which="error_callback_type")  # type: ignore
+
+
+def test_add_callback(node_and_which: tuple[HandlerCoroutine | Job, CallbackType], function_info: CallbackDict):
+    # Setup
+    node, which = node_and_which
+    callback = Callback(**{which: [function_info]})
+
+    # Action
+    node.add_callback(callback)
+    node.add_callback([callback, callback])
+
+    # Assert
+    assert node.callback is not None
+    assert getattr(node.callback, which) == [function_info, function_info, function_info]
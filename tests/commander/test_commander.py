@@ -1,21 +1,22 @@
+import asyncio
 import pytest
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
 
-from unittest.mock import Mock, AsyncMock
-
-
 from agere.commander._commander import (
     PASS_WORD,
     CommanderAsync,
     BasicJob,
     handler,
     Job,
+    TaskNode,
     _is_first_param_bound,
 )
+from agere.commander import CommanderAlreadyRunningError
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def handler_add():
     @handler(PASS_WORD)
     async def _handler_add(self_handler, list_obj) -> None:
@@ -24,7 +25,7 @@ def handler_add():
     return _handler_add
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def job_add(handler_add):
     def _job_add(list_obj: list) -> Job:
         job = BasicJob(job_content=handler_add(list_obj=list_obj))
@@ -32,13 +33,6 @@ def job_add(handler_add):
     return _job_add
 
 
-@pytest.fixture
-def commander():
-    _commander = CommanderAsync()
-    yield _commander
-    _commander.exit()
-
-
 async def test_commander_async_initialization():
     # Action
     commander = CommanderAsync()
@@ -200,7 +194,7 @@ def test_wait_for_exit(job_add, commander: CommanderAsync):
     assert manipulate[0] == 2
 
 
-def test_commander_is_empty(commander, job_add):
+def test_commander_is_empty(commander, job_add, run_executor: ThreadPoolExecutor):
     # Setup
     manipulate = [0]
     job = job_add(manipulate)
@@ -209,7 +203,7 @@ def test_commander_is_empty(commander, job_add):
     assert commander.is_empty()
 
     # Action
-    threading.Thread(target=commander.run_auto, args=(job,)).start()
+    run_executor.submit(commander.run_auto, job)
     commander.wait_for_exit()
 
     # Assert
@@ -217,19 +211,66 @@ def test_commander_is_empty(commander, job_add):
     assert commander.is_empty()
 
 
+def test_commander_reset(run_executor: ThreadPoolExecutor):
+    # Setup
+    commander = CommanderAsync()
+    commander._children.append(TaskNode())
+
+    # Assert
+    assert not commander.is_empty()
+
+    # Action
+    commander.reset()
+
+    # Assert
+    assert commander.is_empty()
+    assert commander._empty_event.is_set()
+
+    # Action
+    run_executor.submit(commander.run)
+    assert commander.wait_until_running(timeout=5)
+
+    # Assert
+    with pytest.raises(CommanderAlreadyRunningError):
+        commander.reset()
+
+    # Action
+    commander.exit()
+
+
+def recording_call():
+    """A light-weight test double for a callback function, it records its calls in the calls attribute."""
+    calls = []
+    def call(*args, **kwargs):
+        calls.append((args, kwargs))
+    call.calls = calls  # type: ignore
+    return call
+
+
+def async_recording_call():
+    """The coroutine function version of recording_call."""
+    calls = []
+    async def call(*args, **kwargs):
+        calls.append((args, kwargs))
+    call.calls = calls  # type: ignore
+    return call
+
+
 async def test_handle_callback(commander: CommanderAsync):
+    from unittest.mock import Mock
+
     # Setup
     mock_callback = Mock()
     mock_task_node = Mock()
     mock_callback._task_node = mock_task_node
-    mock_fn_1 = Mock()
-    mock_fn_2 = Mock()
-    mock_fn_3 = Mock()
-    mock_fn_4 = Mock()
-    mock_fn_5 = AsyncMock()
-    mock_fn_6 = AsyncMock()
-    mock_fn_7 = AsyncMock()
-    mock_fn_8 = AsyncMock()
+    mock_fn_1 = recording_call()
+    mock_fn_2 = recording_call()
+    mock_fn_3 = recording_call()
+    mock_fn_4 = recording_call()
+    mock_fn_5 = async_recording_call()
+    mock_fn_6 = async_recording_call()
+    mock_fn_7 = async_recording_call()
+    mock_fn_8 = async_recording_call()
     callback_list = [
         {
             "function": mock_fn_1, "params": {"args": (1, 2), "kwargs": {"key": "value"}},
@@ -256,43 +297,80 @@ async def test_handle_callback(commander: CommanderAsync):
     await commander._handle_callback(callback=mock_callback, which="at_job_end")
     
     # Assert
-    assert not mock_fn_1.called
-    assert not mock_fn_2.called
-    assert not mock_fn_3.called
-    assert not mock_fn_4.called
-    assert not mock_fn_5.called
-    assert not mock_fn_6.called
-    assert not mock_fn_7.called
-    assert not mock_fn_8.called
+    assert not mock_fn_1.calls  # type: ignore
+    assert not mock_fn_2.calls  # type: ignore
+    assert not mock_fn_3.calls  # type: ignore
+    assert not mock_fn_4.calls  # type: ignore
+    assert not mock_fn_5.calls  # type: ignore
+    assert not mock_fn_6.calls  # type: ignore
+    assert not mock_fn_7.calls  # type: ignore
+    assert not mock_fn_8.calls  # type: ignore
+
+    # Action
+    await commander._handle_callback(callback=mock_callback, which="at_job_start")
+
+    # Assert
+    assert mock_fn_1.calls == [((1, 2), {"key": "value", "task_node": mock_task_node})]  # type: ignore
+    assert mock_fn_2.calls == [((1, 2), {"key": "value"})]  # type: ignore
+    assert mock_fn_3.calls == [((), {"task_node": mock_task_node})]  # type: ignore
+    assert mock_fn_4.calls == [((), {})]  # type: ignore
+    assert mock_fn_5.calls == [((1, 2), {"key": "value", "task_node": mock_task_node})]  # type: ignore
+    assert mock_fn_6.calls == [((1, 2), {"key": "value"})]  # type: ignore
+    assert mock_fn_7.calls == [((), {"task_node": mock_task_node})]  # type: ignore
+    assert mock_fn_8.calls == [((), {})]  # type: ignore
+
+
+async def test_handle_callback_keeps_registration_order(commander: CommanderAsync):
+    from unittest.mock import Mock
+
+    # Setup
+    order = []
+    async def async_first():
+        await asyncio.sleep(0)
+        order.append("async_first")
+    def sync_second():
+        order.append("sync_second")
+    async def async_third():
+        order.append("async_third")
+    mock_callback = Mock()
+    mock_callback.at_job_start = [
+        {"function": async_first},
+        {"function": sync_second},
+        {"function": async_third},
+    ]
 
     # Action
     await commander._handle_callback(callback=mock_callback, which="at_job_start")
 
     # Assert
-    mock_fn_1.assert_called_once_with(1, 2, key="value", task_node=mock_task_node)
-    mock_fn_2.assert_called_once_with(1, 2, key="value")
-    mock_fn_3.assert_called_once_with(task_node=mock_task_node)
-    mock_fn_4.assert_called_once_with()
-    mock_fn_5.assert_called_once_with(1, 2, key="value", task_node=mock_task_node)
-    mock_fn_6.assert_called_once_with(1, 2, key="value")
-    mock_fn_7.assert_called_once_with(task_node=mock_task_node)
-    mock_fn_8.assert_called_once_with()
+    assert order == ["async_first", "sync_second", "async_third"]
 
 
-def test_call_handler_threadsafe(commander: CommanderAsync, job_add, handler_add):
+def test_call_handler_threadsafe(commander: CommanderAsync, job_add, handler_add, run_executor: ThreadPoolExecutor):
     # Setup
     manipulate = [0]
     job = job_add(manipulate)
     handler = handler_add(manipulate)
     
     # Action
-    threading.Thread(target=commander.run, args=(job,)).start()
-    while not commander.running_status:
-        pass
+    run_executor.submit(commander.run, job)
+    assert commander.wait_until_running(timeout=5)
     commander.call_handler_threadsafe(handler)
-    while not commander.is_empty():
-        pass
+    assert commander.wait_until_empty(timeout=5)
     commander.exit()
 
     # Assert
     assert manipulate[0] == 2
+
+
+def test_put_jobs_threadsafe(running_commander: CommanderAsync, job_add):
+    # Setup
+    manipulate = [0]
+    jobs = [job_add(manipulate) for _ in range(3)]
+
+    # Action
+    running_commander.put_jobs_threadsafe(jobs)
+    assert running_commander.wait_until_empty(timeout=5)
+
+    # Assert
+    assert manipulate[0] == 3
@@ -11,55 +11,70 @@ from agere.commander import (
 from agere.commander.edge import add_edge, add_conditional_edge
 
 
-@pytest.fixture
-def handler_example_1():
+# The nodes are decorated once per module, and a fresh node object is created for each test.
+@pytest.fixture(scope="module")
+def handler_func_1():
     @handler(PASS_WORD)
     async def _handler(self_handler):
         self_handler.data["nodes"].append("handler_1")
         self_handler.data["count"] += 1
         return "handler_2" if self_handler.data["count"] > 4 else "job_2"
-    return _handler()
+    return _handler
 
 
-@pytest.fixture
-def handler_example_2():
+@pytest.fixture(scope="module")
+def handler_func_2():
     @handler(PASS_WORD)
     async def _handler(self_handler) -> None:
         self_handler.data["nodes"].append("handler_2")
         self_handler.data["count"] += 1
-    return _handler()
+    return _handler
 
 
-@pytest.fixture
-def job_example_1():
+@pytest.fixture(scope="module")
+def job_class_1():
     class JobExample(Job):
         @tasker(PASS_WORD)
         async def task(self):
             self.data["nodes"].append("job_1")
             self.data["count"] += 1
-    return JobExample()
+    return JobExample
 
 
-@pytest.fixture
-def job_example_2():
+@pytest.fixture(scope="module")
+def job_class_2():
     class JobExample(Job):
         @tasker(PASS_WORD)
         async def task(self):
             self.data["nodes"].append("job_2")
             self.data["count"] += 1
             return "job_1" if self.data["count"] % 3 == 0 else "handler_1"
-    return JobExample()
+    return JobExample
 
 
 @pytest.fixture
-def data():
-    return {"count": 0, "nodes": []}
+def handler_example_1(handler_func_1):
+    return handler_func_1()
+
+
+@pytest.fixture
+def handler_example_2(handler_func_2):
+    return handler_func_2()
+
 
 @pytest.fixture
-def commander():
-    _commander = CommanderAsync()
-    yield _commander
-    _commander.exit()
+def job_example_1(job_class_1):
+    return job_class_1()
+
+
+@pytest.fixture
+def job_example_2(job_class_2):
+    return job_class_2()
+
+
+@pytest.fixture
+def data():
+    return {"count": 0, "nodes": []}
 
 
 def test_add_edge(
@@ -1,9 +1,9 @@
 import pytest
-import threading
-from unittest.mock import Mock, AsyncMock
+from collections import Counter
+from unittest.mock import Mock
 
-from agere.commander import CallbackDict, Callback, CommanderAsync, PASS_WORD, handler
-from agere.commander._commander import HandlerCoroutine
+from agere.commander import CallbackDict, Callback, CommanderAsync, Job, PASS_WORD, handler
+from agere.commander._commander import CallbackType, HandlerCoroutine
 
 
 @pytest.fixture
@@ -11,46 +11,10 @@ def handler_coroutine():
     return HandlerCoroutine()
 
 
-@pytest.fixture
-def commander():
-    _commander = CommanderAsync()
-    yield _commander
-    _commander.exit()
-
-
-def test_add_callback_functions(handler_coroutine: HandlerCoroutine):
-    # Setup
-    function_info: CallbackDict = {"function": Mock()}
-    
-    # Action
-    handler_coroutine.add_callback_functions(functions_info=function_info, which="at_handler_start")
-    handler_coroutine.add_callback_functions(functions_info=[function_info, function_info], which="at_handler_start")
-
-    # Assert
-    assert handler_coroutine.callback is not None
-    assert handler_coroutine.callback.at_handler_start == [function_info, function_info, function_info]
-    with pytest.raises(ValueError):
-        handler_coroutine.add_callback_functions(functions_info=function_info, which="error_callback_type")
-
-
-def test_add_callback(handler_coroutine: HandlerCoroutine):
-    # Setup
-    function_info: CallbackDict = {"function": Mock()}
-    callback = Callback(at_handler_start=[function_info])
-
-    # Action
-    handler_coroutine.add_callback(callback)
-    handler_coroutine.add_callback([callback, callback])
-
-    # Assert
-    assert handler_coroutine.callback is not None
-    assert handler_coroutine.callback.at_handler_start == [function_info, function_info, function_info]
-
-
 def test_call_handler(handler_coroutine: HandlerCoroutine):
     # Setup
-    commander = Mock()
-    handler = Mock()
+    commander = Mock(spec=CommanderAsync)
+    handler = Mock(spec=HandlerCoroutine)
     handler_coroutine._commander = commander
     
     # Action
@@ -62,8 +26,8 @@ def test_call_handler(handler_coroutine: HandlerCoroutine):
 
 async def test_put_job(handler_coroutine: HandlerCoroutine):
     # Setup
-    commander = AsyncMock()
-    job = Mock()
+    commander = Mock(spec=CommanderAsync)
+    job = Mock(spec=Job)
     handler_coroutine._commander = commander
     
     # Action
@@ -73,7 +37,8 @@ async def test_put_job(handler_coroutine: HandlerCoroutine):
     commander._put_job.assert_called_with(job=job, parent=handler_coroutine, requester=None)
 
 
-def test_exception_callback(handler_coroutine: HandlerCoroutine, commander: CommanderAsync):
+@pytest.mark.parametrize("which", ["at_handler_start", "at_exception", "at_handler_end"])
+def test_exception_callback(which: CallbackType, running_commander: CommanderAsync):
     # Setup
     @handler(PASS_WORD)
     async def handler_add(self_handler, obj_list: list):
@@ -83,16 +48,11 @@ def test_exception_callback(handler_coroutine: HandlerCoroutine, commander: Comm
     test_handler = handler_add(manipulate)
     callback_function = Mock()
     function_info: CallbackDict = {"function": callback_function}
-    test_handler.add_callback_functions("at_exception", function_info)
+    test_handler.add_callback_functions(which, function_info)
 
     # Action
-    threading.Thread(target=commander.run).start()
-    while not commander.running_status:
-        pass
-    commander.call_handler_threadsafe(test_handler)
-    while not commander.is_empty():
-        pass
-    commander.exit()
+    running_commander.call_handler_threadsafe(test_handler)
+    assert running_commander.wait_until_empty(timeout=5)
 
     # Assert
     assert callback_function.called
@@ -101,6 +61,8 @@ def test_exception_callback(handler_coroutine: HandlerCoroutine, commander: Comm
 
 
 class HandlerClass:
+    __slots__ = ("obj_list",)
+
     def __init__(self, obj_list: list):
         self.obj_list = obj_list
 
@@ -108,45 +70,37 @@ class HandlerClass:
     async def method_handler(self, self_handler, obj_list: list, *args, **kwargs):
         obj_list[0] += 1
 
-def test_handler_decorator(commander: CommanderAsync):
+def test_handler_decorator(running_commander: CommanderAsync):
     # Setup
     manipulate = [0]
     @handler(PASS_WORD)
     async def nested_handler(self_handler, obj_list: list, *args, **kwargs):
         obj_list[0] += 1
     handlerclass = HandlerClass(manipulate)
-    callback_function = Mock()
+    # Count the injected task nodes as the callbacks are called.
+    task_node_counter = Counter()
+    callback_function = Mock(side_effect=lambda **kwargs: task_node_counter.update(kwargs.values()))
     function_info: CallbackDict = {"function": callback_function, "inject_task_node": True}
-    callback_1 = Callback(at_handler_start=[function_info])
-    callback_2 = Callback(at_handler_start=[function_info])
-    callback_3 = Callback(at_handler_start=[function_info])
-    callback_4 = Callback(at_handler_start=[function_info])
+    # The handler adopts the first Callback it receives and merges the others into it in place,
+    # so every argument needs its own Callback object.
+    callback_1, callback_2, callback_3, callback_4 = (Callback(at_handler_start=[function_info]) for _ in range(4))
     handler_in_class = handlerclass.method_handler(manipulate, callback_1, callback=callback_2)
     a_nested_handler = nested_handler(manipulate, callback_3, callback=callback_4)
 
     # Action
-    threading.Thread(target=commander.run).start()
-    while not commander.running_status:
-        pass
-    commander.call_handler_threadsafe(handler_in_class)
-    commander.call_handler_threadsafe(a_nested_handler)
-    while not commander.is_empty():
-        pass
-    commander.exit()
+    running_commander.call_handler_threadsafe(handler_in_class)
+    running_commander.call_handler_threadsafe(a_nested_handler)
+    assert running_commander.wait_until_empty(timeout=5)
 
     # Assert
     assert manipulate[0] == 2
     assert callback_function.called
-    call_args_list = callback_function.call_args_list
-    kwargs_values = [
-        value for _, kwargs in call_args_list for value in kwargs.values()
-    ]
-    assert kwargs_values.count(handler_in_class) == 2
-    assert kwargs_values.count(a_nested_handler) == 2
+    assert task_node_counter[handler_in_class] == 2
+    assert task_node_counter[a_nested_handler] == 2
     assert callback_function.call_count == 4
 
 
-def test_handler_result(commander: CommanderAsync):
+def test_handler_result(running_commander: CommanderAsync):
     # Setup
     @handler(PASS_WORD)
     async def handler_with_result(self_handler):
@@ -157,20 +111,15 @@ def test_handler_result(commander: CommanderAsync):
     assert test_handler.result is None
 
     # Action
-    threading.Thread(target=commander.run).start()
-    while not commander.running_status:
-        pass
-    commander.call_handler_threadsafe(test_handler)
-    while not commander.is_empty():
-        pass
-    commander.exit()
+    running_commander.call_handler_threadsafe(test_handler)
+    assert running_commander.wait_until_empty(timeout=5)
 
     # Assert
     assert test_handler.state == "COMPLETED"
     assert test_handler.result == "result"
 
 
-def test_exit_commander(commander: CommanderAsync):
+def test_exit_commander(running_commander: CommanderAsync):
     # Setup
     @handler(PASS_WORD)
     async def handle_exit(self_handler):
@@ -178,13 +127,9 @@ def test_exit_commander(commander: CommanderAsync):
     exit_handler = handle_exit()
 
     # Action
-    threading.Thread(target=commander.run).start()
-    while not commander.running_status:
-        pass
-    commander.call_handler_threadsafe(exit_handler)
-    while commander.running_status:
-        pass
+    running_commander.call_handler_threadsafe(exit_handler)
+    running_commander.wait_for_exit()
 
     # Assert
-    assert commander.running_status is False
+    assert running_commander.running_status is False
     assert exit_handler.state == "COMPLETED"
@@ -1,7 +1,6 @@
 import pytest
-from unittest.mock import Mock, AsyncMock
 
-from agere.commander._commander import TaskNode
+from agere.commander._commander import CommanderAsync, TaskNode
 from agere.commander._exceptions import AttributeNotSetError
 
 
@@ -30,14 +29,29 @@ def test_ancestor_chain():
     assert tasknode_4.ancestor_chain == [tasknode_4, tasknode_2, tasknode_1]
 
 
+def test_ancestor_chain_deep():
+    # Setup
+    tasknodes = [TaskNode() for _ in range(2000)]
+    tasknodes[0]._parent = "Null"
+    for parent, child in zip(tasknodes, tasknodes[1:]):
+        parent.add_child(child)
+
+    # Action
+    chain = tasknodes[-1].ancestor_chain
+
+    # Assert
+    assert chain == tasknodes[::-1]
+
+
 async def test_terminate_task_node(tasknode):
+    from unittest.mock import Mock
+
     # Setup
-    tasknode._children.extend([Mock(), Mock()])
-    tasknode_parent = Mock()
-    tasknode_parent.del_child = AsyncMock()
+    tasknode._children.extend([Mock(spec=TaskNode), Mock(spec=TaskNode)])
+    # With a spec, the async methods (del_child, _handle_callback) are AsyncMock automatically.
+    tasknode_parent = Mock(spec=TaskNode)
     tasknode._parent = tasknode_parent
-    commander = Mock()
-    commander._handle_callback = AsyncMock()
+    commander = Mock(spec=CommanderAsync)
     tasknode._commander = commander
     callback = Mock()
     tasknode._callback = callback
@@ -57,6 +71,8 @@ async def test_terminate_task_node(tasknode):
 
 
 async def test_close_task_node():
+    from unittest.mock import Mock
+
     # Setup
     tasknode_1 = TaskNode()
     tasknode_2 = TaskNode()
@@ -64,8 +80,7 @@ async def test_close_task_node():
     tasknode_4 = TaskNode()
     tasknode_5 = TaskNode()
     tasknode_6 = TaskNode()
-    commander = Mock()
-    commander._handle_callback = AsyncMock()
+    commander = Mock(spec=CommanderAsync)
     tasknode_2._commander = commander
     callback = Mock()
     tasknode_2._callback = callback
@@ -1,8 +1,15 @@
-from tests.utils.fixtures.openai_response_fixture import async_openai_response
+from tests.utils.fixtures.openai_response_fixture import async_openai_response, openai_final_arguments
 from tests.utils.fixtures.custom_llm_response_fixture import async_custom_llm_response
 from tests.utils.fixtures.tool_fixtures import (
+    example_tools,
+    tool_example_instance,
     tool_kit_example,
     tool_function_example,
     tool_method_example,
 )
-from tests.utils.fixtures.tools_manager_fixtures import custom_tools_manager, openai_tools_manager
+from tests.utils.fixtures.tools_manager_fixtures import (
+    custom_tools_manager,
+    openai_tools_manager,
+    openai_after_partial_remove,
+    openai_with_function_tool,
+)
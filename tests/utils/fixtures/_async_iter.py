@@ -0,0 +1,10 @@
+from typing import AsyncIterator, Iterable, TypeVar
+
+
+T = TypeVar("T")
+
+
+async def async_iter(iterable: Iterable[T]) -> AsyncIterator[T]:
+    """Yield the items of a (sync) iterable as an async iterator."""
+    for item in iterable:
+        yield item
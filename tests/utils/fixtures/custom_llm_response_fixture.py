@@ -1,6 +1,8 @@
 import pytest
 from typing import AsyncIterable
 
+from tests.utils.fixtures._async_iter import async_iter
+
 
 response = [
     "Turning off ",
@@ -27,9 +29,4 @@ response = [
 
 @pytest.fixture
 def async_custom_llm_response() -> AsyncIterable:
-    
-    async def async_gen(iterable):
-        for item in iterable:
-            yield item
-
-    return async_gen(response)
+    return async_iter(response)
@@ -2,13 +2,15 @@ import pytest
 from dataclasses import dataclass
 from typing import AsyncIterable
 
+from tests.utils.fixtures._async_iter import async_iter
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ChoiceDeltaToolCallFunction:
     arguments: str | None = None
     name: str | None = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChoiceDeltaToolCall:
     index: int = 0
     id: str | None = None
@@ -16,31 +18,31 @@ class ChoiceDeltaToolCall:
     type: str | None = None
     
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChoiceDelta:
     content: str | None = None
-    function_call: list | None = None
+    function_call: tuple | None = None
     role: str | None = None
-    tool_calls: list[ChoiceDeltaToolCall] | None = None
+    tool_calls: tuple[ChoiceDeltaToolCall, ...] | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Choice:
     delta: ChoiceDelta | None = None
-    choices: list | None = None
+    choices: tuple | None = None
     finish_reason: str | None = None
     index: int = 0
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChatCompletionChunk:
     id: str | None = None
-    choices: list | None = None
+    choices: tuple | None = None
 
-response = [
+response = (
     # Chunk No.1
     ChatCompletionChunk(
         id='chatcmpl-8Rz2q1FonSqzWAexwcszkWHyQoMgH',
-        choices=[
+        choices=(
             Choice(
                 delta=ChoiceDelta(
                     content=None,
@@ -50,19 +52,19 @@ response = [
                 ),
                 finish_reason=None,
                 index=0
-            )
-        ],
+            ),
+        ),
     ),
     # Chunk No.2
     ChatCompletionChunk(
         id='chatcmpl-8Rz2q1FonSqzWAexwcszkWHyQoMgH',
-        choices=[
+        choices=(
             Choice(
                 delta=ChoiceDelta(
                     content=None,
                     function_call=None,
                     role=None,
-                    tool_calls=[
+                    tool_calls=(
                         ChoiceDeltaToolCall(
                             index=0,
                             id='call_vM7ZCfu7VF0curI2YwIpCNVh',
@@ -71,24 +73,24 @@ response = [
                                 name='get_current_weather'
                             ),
                             type='function'
-                        )
-                    ]
+                        ),
+                    )
                 ),
                 finish_reason=None,
                 index=0
-            )
-        ], 
+            ),
+        ), 
     ),
     # Chunk No.3
     ChatCompletionChunk(
         id='chatcmpl-8Rz2q1FonSqzWAexwcszkWHyQoMgH',
-        choices=[
+        choices=(
             Choice(
                 delta=ChoiceDelta(
                     content=None,
                     function_call=None,
                     role=None,
-                    tool_calls=[
+                    tool_calls=(
                         ChoiceDeltaToolCall(
                             index=0,
                             id=None,
@@ -97,24 +99,24 @@ response = [
                                 name=None
                             ),
                             type=None
-                        )
-                    ]
+                        ),
+                    )
                 ),
                 finish_reason=None,
                 index=0
-            )
-        ],
+            ),
+        ),
     ),
     # Chunk No.4
     ChatCompletionChunk(
         id='chatcmpl-8Rz2q1FonSqzWAexwcszkWHyQoMgH',
-        choices=[
+        choices=(
             Choice(
                 delta=ChoiceDelta(
                     content=None,
                     function_call=None,
                     role=None,
-                    tool_calls=[
+                    tool_calls=(
                         ChoiceDeltaToolCall(
                             index=0,
                             id=None,
@@ -123,24 +125,24 @@ response = [
                                 name=None
                             ),
                             type=None
-                        )
-                    ]
+                        ),
+                    )
                 ),
                 finish_reason=None,
                 index=0
-            )
-        ],
+            ),
+        ),
     ),
     # Chunk No.5 to the second-to-last chunk before the tools call ends.
     ChatCompletionChunk(
         id='chatcmpl-8Rz2q1FonSqzWAexwcszkWHyQoMgH',
-        choices=[
+        choices=(
             Choice(
                 delta=ChoiceDelta(
                     content=None,
                     function_call=None,
                     role=None,
-                    tool_calls=[
+                    tool_calls=(
                         ChoiceDeltaToolCall(
                             index=0,
                             id=None,
@@ -149,23 +151,23 @@ response = [
                                 name=None
                             ),
                             type=None
-                        )
-                    ]
+                        ),
+                    )
                 ),
                 finish_reason=None,
                 index=0
-            )
-        ],
+            ),
+        ),
     ),
     ChatCompletionChunk(
         id='chatcmpl-8Rz2q1FonSqzWAexwcszkWHyQoMgH',
-        choices=[
+        choices=(
             Choice(
                 delta=ChoiceDelta(
                     content=None,
                     function_call=None,
                     role=None,
-                    tool_calls=[
+                    tool_calls=(
                         ChoiceDeltaToolCall(
                             index=0,
                             id=None,
@@ -174,24 +176,24 @@ response = [
                                 name=None
                             ),
                             type=None
-                        )
-                    ]
+                        ),
+                    )
                 ),
                 finish_reason=None,
                 index=0
-            )
-        ],
+            ),
+        ),
     ),
     # The last chunk in first tools call.
     ChatCompletionChunk(
         id='chatcmpl-8Rz2q1FonSqzWAexwcszkWHyQoMgH',
-        choices=[
+        choices=(
             Choice(
                 delta=ChoiceDelta(
                     content=None,
                     function_call=None,
                     role=None,
-                    tool_calls=[
+                    tool_calls=(
                         ChoiceDeltaToolCall(
                             index=0,
                             id=None,
@@ -200,24 +202,24 @@ response = [
                                 name=None
                             ),
                             type=None
-                        )
-                    ]
+                        ),
+                    )
                 ),
                 finish_reason=None,
                 index=0
-            )
-        ],
+            ),
+        ),
     ),
     # Chunk No.1 to call the second tool.
     ChatCompletionChunk(
         id='chatcmpl-8Rz2q1FonSqzWAexwcszkWHyQoMgH',
-        choices=[
+        choices=(
             Choice(
                 delta=ChoiceDelta(
                     content=None,
                     function_call=None,
                     role=None,
-                    tool_calls=[
+                    tool_calls=(
                         ChoiceDeltaToolCall(
                             index=1,
                             id='call_AOefM0a9RMWTiJmOSDsW2mZM',
@@ -226,24 +228,24 @@ response = [
                                 name='get_current_weather'
                             ),
                             type='function'
-                        )
-                    ]
+                        ),
+                    )
                 ),
                 finish_reason=None,
                 index=0
-            )
-        ],
+            ),
+        ),
     ),
     # Chunk No.2- to call the second tool.
     ChatCompletionChunk(
         id='chatcmpl-8Rz2q1FonSqzWAexwcszkWHyQoMgH',
-        choices=[
+        choices=(
             Choice(
                 delta=ChoiceDelta(
                     content=None,
                     function_call=None,
                     role=None,
-                    tool_calls=[
+                    tool_calls=(
                         ChoiceDeltaToolCall(
                             index=1,
                             id=None,
@@ -252,24 +254,24 @@ response = [
                                 name=None
                             ),
                             type=None
-                        )
-                    ]
+                        ),
+                    )
                 ),
                 finish_reason=None,
                 index=0
-            )
-        ],
+            ),
+        ),
     ),
     # Last chunk in tool_calls.
     ChatCompletionChunk(
         id='chatcmpl-8Rz2q1FonSqzWAexwcszkWHyQoMgH',
-        choices=[
+        choices=(
             Choice(
                 delta=ChoiceDelta(
                     content=None,
                     function_call=None,
                     role=None,
-                    tool_calls=[
+                    tool_calls=(
                         ChoiceDeltaToolCall(
                             index=1,
                             id=None,
@@ -278,18 +280,18 @@ response = [
                                 name=None
                             ),
                             type=None
-                        )
-                    ]
+                        ),
+                    )
                 ),
                 finish_reason=None,
                 index=0
-            )
-        ],
+            ),
+        ),
     ),
     # Last chunk of all.
     ChatCompletionChunk(
         id='chatcmpl-8Rz2q1FonSqzWAexwcszkWHyQoMgH',
-        choices=[
+        choices=(
             Choice(
                 delta=ChoiceDelta(
                     content=None,
@@ -299,17 +301,23 @@ response = [
                 ),
                 finish_reason='tool_calls',
                 index=0
-            )
-        ],
+            ),
+        ),
     ),
-]
+)
+
+# The arguments of each tool call in response, as they read once all the streamed fragments are joined.
+final_arguments = (
+    '{"to_user": "I am search \\"weather\\" for you.", "location": "Paris"}',
+    '{"to_user": "I am search weather in Beijing.", "location": "Beijing", "unit": "celsius"}',
+)
 
 
 @pytest.fixture
 def async_openai_response() -> AsyncIterable:
-            
-    async def async_gen(iterable):
-        for item in iterable:
-            yield item
-    
-    return async_gen(response)
+    return async_iter(response)
+
+
+@pytest.fixture
+def openai_final_arguments() -> tuple[str, ...]:
+    return final_arguments
@@ -8,68 +8,78 @@ from agere.utils.tool import (
 )
 
 
-kit_example = ToolKit()
+@pytest.fixture(scope="session")
+def example_tools():
+    # The tools are built on first use, so that collecting the tests that do not need them stays cheap.
+    kit_example = ToolKit()
 
-@tool(description="The description for the tool.")
-@tool_parameter(
-    name="value",
-    description="The description for the parameter of name.",
-    default_value=1,
-    choices=[1, 3, 5,7],
-)
-def tool_function_example_(value: int = 1) -> int:
-    return value
-
-@tool(description="This is a example tool which says hello to someone.")
-@tool_kit(
-    kit=kit_example,
-    description="The description for the kit."
-)
-@tool_parameter(
-    name="name",
-    description="The name to say hello."
-)
-def tool_say_hello_example(name: str) -> str:
-    return f"Hi, {name}!"
-
-@tool
-@tool_kit(kit=kit_example)
-def tool_say_goodbye_example(name: str) -> str:
-    """This is a example tool which says goodbye to someone.
-
-    Args:
-        name (str): The name to say goodbye.
-    """
-    return f"Goodbye, {name}"
+    @tool(description="The description for the tool.")
+    @tool_parameter(
+        name="value",
+        description="The description for the parameter of name.",
+        default_value=1,
+        choices=[1, 3, 5,7],
+    )
+    def tool_function_example_(value: int = 1) -> int:
+        return value
 
-class ToolExample:
-    @tool
+    @tool(description="This is a example tool which says hello to someone.")
+    @tool_kit(
+        kit=kit_example,
+        description="The description for the kit."
+    )
     @tool_parameter(
-        name="value2",
-        description="The second value.",
-        default_value=2,
+        name="name",
+        description="The name to say hello."
     )
-    def tool_method_example(self, value1: int, value2: int = 0) -> int:
-        """This is a tool example which is a class method.
+    def tool_say_hello_example(name: str) -> str:
+        return f"Hi, {name}!"
 
-        This tool return the addition of the given two value.
+    @tool
+    @tool_kit(kit=kit_example)
+    def tool_say_goodbye_example(name: str) -> str:
+        """This is a example tool which says goodbye to someone.
 
         Args:
-            value1 (int): The first value.
-            value2 (int): The second value.
+            name (str): The name to say goodbye.
         """
-        return value1 + value2
+        return f"Goodbye, {name}"
+
+    class ToolExample:
+        @tool
+        @tool_parameter(
+            name="value2",
+            description="The second value.",
+            default_value=2,
+        )
+        def tool_method_example(self, value1: int, value2: int = 0) -> int:
+            """This is a tool example which is a class method.
+
+            This tool return the addition of the given two value.
+
+            Args:
+                value1 (int): The first value.
+                value2 (int): The second value.
+            """
+            return value1 + value2
+
+    return tool_function_example_, ToolExample, kit_example
 
 @pytest.fixture
-def tool_function_example():
-    tool = tool_function_example_
+def tool_function_example(example_tools):
+    tool = example_tools[0]
     tool.__name__ = "tool_function_example"
-    return tool_function_example_
+    return tool
+
+@pytest.fixture(scope="session")
+def tool_example_instance(example_tools):
+    # The instance holds no state, so one is enough for the whole session.
+    return example_tools[1]()
 
 @pytest.fixture
-def tool_method_example():
-    return ToolExample().tool_method_example
+def tool_method_example(tool_example_instance):
+    return tool_example_instance.tool_method_example
 
 @pytest.fixture
-def tool_kit_example():
-    return kit_example
+def tool_kit_example(example_tools):
+    return example_tools[2]
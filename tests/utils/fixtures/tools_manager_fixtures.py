@@ -32,3 +32,25 @@ def openai_tools_manager() -> ToolsManagerInterface:
         tool_token_counter=tool_token_counter,
     )
     return ToolsManager(tool_model=openai_tool_model)
+
+@pytest.fixture
+def openai_after_partial_remove(
+    openai_tools_manager,
+    tool_function_example,
+    tool_method_example,
+    tool_kit_example,
+) -> ToolsManagerInterface:
+    openai_tools_manager.add_tools(
+        tools=[tool_function_example, tool_method_example, tool_kit_example],
+        tool_type="PERMANENT",
+    )
+    openai_tools_manager.remove_tools(tools=[tool_method_example, tool_kit_example], tool_type="PERMANENT")
+    return openai_tools_manager
+
+@pytest.fixture
+def openai_with_function_tool(
+    openai_tools_manager,
+    tool_function_example,
+) -> tuple[ToolsManagerInterface, list]:
+    openai_tools_manager.add_tool(tool_function_example)
+    return openai_tools_manager, openai_tools_manager.get_tools_manual(by_names=["tool_function_example"])
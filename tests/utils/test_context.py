@@ -1,6 +1,7 @@
 import copy
 import pytest
 from typing import TypedDict
+from unittest.mock import patch
 
 from agere.utils.context import Context, ContextPieceTypeError, ContextTokenError, _find_position
 from agere.utils.context_models import OpenaiContextModel
@@ -166,10 +167,14 @@ class TestContext:
             "content": "Hi." * 20,
         }
 
-        custom_context.bead_update(new_beads=bead_example, which="START")
-        custom_context.bead_update(new_beads=bead_example, which="END")
-        custom_context.bead_update(new_beads=bead_example, which="FLOWING")
-        custom_context.bead_update(new_beads=bead_example, which="FIXED", fixed=-1)
+        custom_context.bead_bulk_update(
+            {
+                "START": bead_example,
+                "END": bead_example,
+                "FLOWING": bead_example,
+                "FIXED": {-1: bead_example},
+            }
+        )
 
         # Action
         state = custom_context.context_append(piece=short_piece)
@@ -198,10 +203,14 @@ class TestContext:
             "content": "Hi.",
         }
 
-        custom_context.bead_update(new_beads=bead_example, which="START")
-        custom_context.bead_update(new_beads=bead_example, which="END")
-        custom_context.bead_update(new_beads=bead_example, which="FLOWING")
-        custom_context.bead_update(new_beads=bead_example, which="FIXED", fixed=-1)
+        custom_context.bead_bulk_update(
+            {
+                "START": bead_example,
+                "END": bead_example,
+                "FLOWING": bead_example,
+                "FIXED": {-1: bead_example},
+            }
+        )
 
         # Action
         state = custom_context.context_extend(piece_list=[short_piece])
@@ -328,6 +337,18 @@ class TestContext:
         # Assert
         assert token_num == 152
 
+        # Action
+        custom_context.context_append(piece={"role": "user", "content": "Hi."}, max_sending_token_num="inf")
+
+        # Assert
+        assert custom_context.token_num == 156
+
+        # Action
+        custom_context.context_update(context_piece_list[:2])
+
+        # Assert
+        assert custom_context.token_num == 15
+
     def test_context_ratio(
         self,
         custom_context: Context,
@@ -336,10 +357,14 @@ class TestContext:
     ):
         # Setup
         custom_context.max_sending_token_num = 200
-        custom_context.bead_update(new_beads=bead_example, which="START")
-        custom_context.bead_update(new_beads=bead_example, which="END")
-        custom_context.bead_update(new_beads=bead_example, which="FLOWING")
-        custom_context.bead_update(new_beads=bead_example, which="FIXED", fixed=-1)
+        custom_context.bead_bulk_update(
+            {
+                "START": bead_example,
+                "END": bead_example,
+                "FLOWING": bead_example,
+                "FIXED": {-1: bead_example},
+            }
+        )
         custom_context.context_extend(piece_list=context_piece_list[:2])
 
         # Action
@@ -356,6 +381,40 @@ class TestContext:
         assert context_ratio_4 == (15 + 31) / 200
         assert context_ratio_5 == (15 + 31*3) / 300
 
+    def test_context_ratio_without_modifier(
+        self,
+        bead_example: list[CustomContextPiece],
+        context_piece_list: list[CustomContextPiece]
+    ):
+        # Setup
+        context = Context(
+            context_model=OpenaiContextModel(token_counter=self.piece_token_counter),
+            max_sending_token_num=200,
+        )
+        context.bead_bulk_update(
+            {
+                "START": bead_example,
+                "END": bead_example,
+                "FLOWING": bead_example,
+                "FIXED": {-1: bead_example},
+            }
+        )
+        context.context_extend(piece_list=context_piece_list[:2])
+
+        # Action
+        context_ratio_1 = context.context_ratio()
+        context_ratio_2 = context.context_ratio(context=False)
+        context_ratio_3 = context.context_ratio(bead=["START", "FIXED"])
+        context_ratio_4 = context.context_ratio(bead=["FIXED", "END"], fixed=[])
+        context_ratio_5 = context.context_ratio(bead=["START", "FIXED", "FLOWING"], max_sending_token_num=300)
+
+        # Assert
+        assert context_ratio_1 == (13 + 30*4) / 200
+        assert context_ratio_2 == (30*4) / 200
+        assert context_ratio_3 == (13 + 30*2) / 200
+        assert context_ratio_4 == (13 + 30) / 200
+        assert context_ratio_5 == (13 + 30*3) / 300
+
     def test_bead_append(self, custom_context: Context, bead_example: list[CustomContextPiece]):
         # Action
         custom_context.bead_append(bead=bead_example[0], which="START")
@@ -419,6 +478,41 @@ class TestContext:
 
         with pytest.raises(ValueError):
             custom_context.bead_update(new_beads=bead_example, which="FIXED")
+
+    def test_bead_bulk_update(self, custom_context: Context, bead_example: list[CustomContextPiece]):
+        # Setup
+        custom_context.bead_extend(beads = bead_example * 2, which="START")
+        custom_context.bead_extend(beads = bead_example * 2, which="FIXED", fixed=2)
+        custom_context.bead_extend(beads = bead_example * 2, which="FIXED", fixed=-1)
+
+        # Action
+        custom_context.bead_bulk_update(
+            {
+                "START": bead_example,
+                "FLOWING": bead_example,
+                "FIXED": {2: bead_example},
+                "END": bead_example,
+            }
+        )
+
+        # Assert
+        assert custom_context.bead_content == {
+            "START": bead_example,
+            "FLOWING": bead_example,
+            "FIXED": {
+                2: bead_example,
+                -1: bead_example * 2,
+            },
+            "END": bead_example,
+        }
+        assert custom_context.bead_lengths["FIXED"] == {2: [30], -1: [30, 30]}
+
+        # Assert
+        with pytest.raises(ContextPieceTypeError):
+            custom_context.bead_bulk_update({"START": [], "END": [{"content": "No role."}]})
+        assert custom_context.bead_content["START"] == bead_example
+        with pytest.raises(ValueError):
+            custom_context.bead_bulk_update({"FIXED": bead_example})
     
     def test_bead_piece_overwrite(self, custom_context: Context, bead_example: list[CustomContextPiece]):
         # Setup
@@ -508,6 +602,61 @@ class TestContext:
         # Assert
         assert custom_context.piece_token_list == [5, 8] * 9 + [6, 9]
 
+    def test_piece_token_list_reuse(self, custom_context: Context, context_piece_list: list[CustomContextPiece]):
+        # Setup
+        custom_context.context_extend(context_piece_list, max_sending_token_num="inf")
+
+        # Action
+        with patch.object(
+            custom_context.context_model,
+            "token_counter",
+            wraps=custom_context.context_model.token_counter,
+        ) as token_counter:
+            trimmed_piece_list = custom_context.trim_piece_list_by_token_num(
+                piece_list=custom_context.context,
+                max_token_num=100,
+                modifier=True,
+            )
+
+        # Assert
+        token_counter.assert_not_called()
+        assert trimmed_piece_list == context_piece_list[8:]
+
+        # Action
+        custom_context.context[-1]["content"] = "x" * 120
+        custom_context.context_update(custom_context.context)
+
+        # Assert
+        assert custom_context.piece_token_list[-1] == 120
+        assert custom_context.token_num == (5 + 8) * 9 + 6 + 120 + 20
+
+        # Action
+        custom_context.context.pop()
+
+        # Assert
+        assert custom_context.piece_token_list == [5, 8] * 9 + [6]
+
+    def test_edited_piece_counted_again_when_added(self, custom_context: Context):
+        # Setup
+        piece = {"role": "user", "content": "Hi"}
+
+        # Action
+        custom_context.context_append(piece)
+        piece["content"] = "word " * 10
+        custom_context.bead_append(piece, which="START")
+        piece["content"] = "Hello"
+        custom_context.bead_extend([piece], which="END")
+        piece["content"] = "Hello, world."
+        custom_context.context_append(piece, max_sending_token_num="inf")
+        piece["content"] = "Bye."
+        custom_context.context_extend([piece], max_sending_token_num="inf")
+
+        # Assert
+        assert custom_context.piece_token_list == [2, 13, 4]
+        assert custom_context.bead_lengths["START"] == [50]
+        assert custom_context.bead_lengths["END"] == [5]
+        assert custom_context.token_num == 2 + 13 + 4 + 3
+
     def test_validate_piece_type(self, custom_context: Context, openai_context: Context):
         # Setup
         right_piece = {
@@ -546,6 +695,37 @@ class TestContext:
         # Assert
         assert custom_context.flowing_bead_position == 20
 
+    def test_reset(
+        self,
+        custom_context: Context,
+        context_piece_list: list[CustomContextPiece],
+        bead_example: list[CustomContextPiece],
+    ):
+        # Setup
+        custom_context.context_update(context_piece_list)
+        custom_context.bead_extend(beads=bead_example, which="FLOWING")
+        custom_context.bead_extend(beads=bead_example, which="FIXED", fixed=-1)
+        custom_context.shift_flowing_bead()
+
+        # Action
+        custom_context.reset()
+
+        # Assert
+        assert custom_context.context == []
+        assert custom_context.token_num == 0
+        assert custom_context.flowing_bead_position == 0
+        assert custom_context.bead_content == {"START": [], "FLOWING": [], "FIXED": {}, "END": []}
+        assert custom_context.bead_lengths == {"START": [], "FLOWING": [], "FIXED": {}, "END": []}
+        assert len(context_piece_list) == 20
+        assert custom_context.max_sending_token_num == 50
+
+        # Action
+        custom_context.context_extend(context_piece_list[:2], max_sending_token_num="inf")
+
+        # Assert
+        assert custom_context.piece_token_list == [5, 8]
+        assert custom_context.token_num == 15
+
     def test_trim_piece_list_by_token_num(self, custom_context: Context, context_piece_list: list[CustomContextPiece]):
         # Action
         trimmed_piece_list = custom_context.trim_piece_list_by_token_num(
@@ -566,7 +746,23 @@ class TestContext:
 
         # Assert
         assert trimmed_piece_list == context_piece_list[8:]
-    
+
+    def test_trim_context_after_append(self, custom_context: Context, context_piece_list: list[CustomContextPiece]):
+        # Setup
+        custom_context.context_extend(context_piece_list[:10], max_sending_token_num="inf")
+        custom_context.trim_piece_list_by_token_num(custom_context.context, max_token_num=100, modifier=False)
+        custom_context.context_extend(context_piece_list[10:], max_sending_token_num="inf")
+
+        # Action
+        trimmed_piece_list = custom_context.trim_piece_list_by_token_num(
+            piece_list=custom_context.context,
+            max_token_num=100,
+            modifier=False,
+        )
+
+        # Assert
+        assert trimmed_piece_list == context_piece_list[6:]
+
     def test_context_sending(
         self,
         custom_context: Context,
@@ -1,22 +1,38 @@
+import asyncio
 import json
 
+import pytest
+
 from agere.utils.dispatcher import async_dispatcher_tools_call_for_openai
 
 
-async def test_dispatcher(async_openai_response):
+async def _drain(generator) -> list:
+    return [value async for value in generator]
+
+
+@pytest.mark.parametrize("concurrent", [False, True], ids=["sequential", "concurrent"])
+async def test_dispatcher(async_openai_response, openai_final_arguments, concurrent: bool):
     # Setup
     async_iterable = async_openai_response
+    # The to_user parameter is split off from the arguments of the tool calls.
+    expected_arguments = []
+    for final_arguments in openai_final_arguments:
+        arguments = json.loads(final_arguments)
+        del arguments["to_user"]
+        expected_arguments.append(arguments)
 
     # Action
     make_role_generator = await async_dispatcher_tools_call_for_openai(source=async_iterable)
     to_user_gen = make_role_generator("to_user")
     function_call_gen = make_role_generator("tool_call")
-    to_user_list = []
-    function_call_list = []
-    async for to_user in to_user_gen:
-        to_user_list.append(to_user)
-    async for function_call in function_call_gen:
-        function_call_list.append(function_call)
+    if concurrent:
+        to_user_list, function_call_list = await asyncio.gather(
+            _drain(to_user_gen),
+            _drain(function_call_gen),
+        )
+    else:
+        to_user_list = await _drain(to_user_gen)
+        function_call_list = await _drain(function_call_gen)
 
     # Assert
     assert ''.join(to_user_list) == ''.join(['I am search \\"weather\\" for you.', '\n', 'I am search weather in Beijing.'])
@@ -25,13 +41,13 @@ async def test_dispatcher(async_openai_response):
             "tool_call_index": 0,
             "tool_call_id": "call_vM7ZCfu7VF0curI2YwIpCNVh",
             "name": "get_current_weather",
-            "arguments": {"location": "Paris"},
+            "arguments": expected_arguments[0],
         },
         {
             "tool_call_index": 1,
             "tool_call_id": "call_AOefM0a9RMWTiJmOSDsW2mZM",
             "name": "get_current_weather",
-            "arguments": {"location": "Beijing", "unit": "celsius"}
+            "arguments": expected_arguments[1],
         },
     ]
     for i in range(2):
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import Mock
 
@@ -8,9 +9,10 @@ from agere.utils.llm_async_converters import LLMAsyncAdapter, CallbackDict
 def llm_async_adapter():
     return LLMAsyncAdapter()
 
-async def test_llm_to_async_iterable(llm_async_adapter: LLMAsyncAdapter):
+@pytest.mark.parametrize("make_response", [list, iter], ids=["list", "iterator"])
+async def test_llm_to_async_iterable(llm_async_adapter: LLMAsyncAdapter, make_response):
     # Setup
-    response = ["a", "b", "c", "d"]
+    response = make_response(["a", "b", "c", "d"])
     
     # Action
     async_iterable = llm_async_adapter.llm_to_async_iterable(response=response)
@@ -46,3 +48,35 @@ async def test_callback(llm_async_adapter: LLMAsyncAdapter):
     at_receiving_end_callback.assert_called_with("arg1", "arg2", kwarg="kwarg")
     assert at_receiving_start_callback.call_count == 1
     assert at_receiving_end_callback.call_count == 1
+
+async def test_callbacks_keep_registration_order(llm_async_adapter: LLMAsyncAdapter):
+    # Setup
+    order = []
+
+    async def async_first():
+        await asyncio.sleep(0)
+        order.append("async_first")
+
+    def sync_second():
+        order.append("sync_second")
+
+    async def async_third():
+        order.append("async_third")
+
+    at_receiving_start: list[CallbackDict] = [
+        {"function": async_first},
+        {"function": sync_second},
+        {"function": async_third},
+    ]
+    response = ["a", "b"]
+
+    # Action
+    async_iterable = llm_async_adapter.llm_to_async_iterable(
+        response=response,
+        at_receiving_start=at_receiving_start,
+    )
+    messages = [x async for x in async_iterable]
+
+    # Assert
+    assert messages == ["a", "b"]
+    assert order == ["async_first", "sync_second", "async_third"]
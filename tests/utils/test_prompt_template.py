@@ -134,3 +134,22 @@ def test_prompt_template_unfilled_variabels(prompt_template: str):
     
     # Assert
     assert template.unfilled_variables == []
+
+def test_prompt_template_unfilled_variables_after_assignment(prompt_template: str):
+    # Setup
+    template = PromptTemplate(prompt_template)
+    template.unfilled_variables.clear()
+
+    # Action
+    template.render(wrong_var="wrong")
+
+    # Assert
+    assert template.prompt_template == prompt_template
+    assert template.unfilled_variables == ["name", "number"]
+
+    # Action
+    template.prompt_template = "Hello, {{ who }}!"
+
+    # Assert
+    assert template.unfilled_variables == ["who"]
+    assert template.render(who="world").prompt == "Hello, world!"
@@ -4,24 +4,71 @@ import pytest
 from agere.utils.tool import ToolsManagerInterface, ToolMetadata
 
 
+CUSTOM_TO_USER = ''.join(
+    [
+        "Turning off ",
+        "the light for you.",
+        "Checking the weather for you, please wait.",
+    ],
+)
+CUSTOM_TOOL_CALLS = [
+    {
+        "name": "light_off",
+        "parameters": {},
+    },
+    {
+        "name": "get_weather",
+        "parameters": {
+            "position": "Hangzhou",
+            "unit": "celsius",
+        }
+    },
+]
+OPENAI_TO_USER = ''.join(
+    [
+        'I am search \\"weather\\" for you.',
+        '\n',
+        'I am search weather in Beijing.',
+    ],
+)
+OPENAI_TOOL_CALLS = [
+    {
+        "tool_call_index": 0,
+        "tool_call_id": "call_vM7ZCfu7VF0curI2YwIpCNVh",
+        "name": "get_current_weather",
+        "arguments": {"location": "Paris"},
+    },
+    {
+        "tool_call_index": 1,
+        "tool_call_id": "call_AOefM0a9RMWTiJmOSDsW2mZM",
+        "name": "get_current_weather",
+        "arguments": {"location": "Beijing", "unit": "celsius"}
+    },
+]
+
+
 class TestTool:
-    def test_tool_model_name(
+    @pytest.mark.parametrize(
+        "tools_manager_fixture, tool_model_name, tool_model_type",
+        [
+            ("custom_tools_manager", "CUSTOM", "CUSTOM"),
+            ("openai_tools_manager", "OPENAI", "PROVIDED"),
+        ],
+        ids=["custom", "openai"],
+    )
+    def test_tool_model_name_and_type(
         self,
-        custom_tools_manager: ToolsManagerInterface,
-        openai_tools_manager: ToolsManagerInterface
+        request: pytest.FixtureRequest,
+        tools_manager_fixture: str,
+        tool_model_name: str,
+        tool_model_type: str,
     ):
-        # Assert
-        assert custom_tools_manager.tool_model_name == "CUSTOM"
-        assert openai_tools_manager.tool_model_name == "OPENAI"
+        # Setup
+        tools_manager: ToolsManagerInterface = request.getfixturevalue(tools_manager_fixture)
 
-    def test_tool_model_type(
-        self,
-        custom_tools_manager: ToolsManagerInterface,
-        openai_tools_manager: ToolsManagerInterface
-    ):
         # Assert
-        assert custom_tools_manager.tool_model_type == "CUSTOM"
-        assert openai_tools_manager.tool_model_type == "PROVIDED"
+        assert tools_manager.tool_model_name == tool_model_name
+        assert tools_manager.tool_model_type == tool_model_type
 
     def test_add_tool(
         self,
@@ -68,43 +115,17 @@ class TestTool:
         # Assert
         assert set(temporary_tools_names) == {"tool_method_example"}
     
-    def test_remove_tools(
-        self,
-        openai_tools_manager: ToolsManagerInterface,
-        tool_function_example,
-        tool_method_example,
-        tool_kit_example,
-    ):
-        # Setup
-        openai_tools_manager.add_tools(
-            tools=[tool_function_example, tool_method_example, tool_kit_example],
-            tool_type="PERMANENT",
-        )
-        
+    def test_remove_tools(self, openai_after_partial_remove: ToolsManagerInterface):
         # Action
-        openai_tools_manager.remove_tools(tools=[tool_method_example, tool_kit_example], tool_type="PERMANENT")
-        permanent_tools_names = [metadata.name for metadata in openai_tools_manager.get_tools_metadata(by_types=["PERMANENT"])]
+        permanent_tools_names = [metadata.name for metadata in openai_after_partial_remove.get_tools_metadata(by_types=["PERMANENT"])]
         
         # Assert
         assert set(permanent_tools_names) == {"tool_function_example"}
 
-    def test_clear_tools(
-        self,
-        openai_tools_manager: ToolsManagerInterface,
-        tool_function_example,
-        tool_method_example,
-        tool_kit_example,
-    ):
-        # Setup
-        openai_tools_manager.add_tools(
-            tools=[tool_function_example, tool_method_example, tool_kit_example],
-            tool_type="PERMANENT",
-        )
-        
+    def test_clear_tools(self, openai_after_partial_remove: ToolsManagerInterface):
         # Action
-        openai_tools_manager.remove_tools(tools=[tool_method_example, tool_kit_example], tool_type="PERMANENT")
-        openai_tools_manager.clear_tools(tool_type="PERMANENT")
-        permanent_tools_names = [metadata.name for metadata in openai_tools_manager.get_tools_metadata(by_types=["PERMANENT"])]
+        openai_after_partial_remove.clear_tools(tool_type="PERMANENT")
+        permanent_tools_names = [metadata.name for metadata in openai_after_partial_remove.get_tools_metadata(by_types=["PERMANENT"])]
         
         # Assert
         assert permanent_tools_names == []
@@ -125,34 +146,31 @@ class TestTool:
             "tool_say_goodbye_example",
         }
 
-    def test_unregister_tools(
+    def test_registration_lifecycle(
         self,
         openai_tools_manager: ToolsManagerInterface,
         tool_function_example,
         tool_method_example,
         tool_kit_example,
     ):
-        # Setup
+        # Action
         openai_tools_manager.register_tools(tools=[tool_function_example, tool_kit_example, tool_method_example])
 
+        # Assert
+        assert set(openai_tools_manager.registered_tool_names) == {
+            "tool_function_example",
+            "tool_say_hello_example",
+            "tool_say_goodbye_example",
+            "tool_method_example",
+        }
+
         # Action
         openai_tools_manager.unregister_tools(tools=["tool_method_example", tool_kit_example])
 
         # Assert
         assert openai_tools_manager.registered_tool_names == ["tool_function_example"]
 
-    def test_clear_registered_tools(
-        self,
-        openai_tools_manager: ToolsManagerInterface,
-        tool_function_example,
-        tool_method_example,
-        tool_kit_example,
-    ):
-        # Setup
-        openai_tools_manager.register_tools(tools=[tool_function_example, tool_kit_example, tool_method_example])
-
         # Action
-        openai_tools_manager.unregister_tools(tools=["tool_method_example", tool_kit_example])
         openai_tools_manager.clear_registered_tools()
 
         # Assert
@@ -310,7 +328,6 @@ class TestTool:
     def test_wrap_tools_to_bead(
         self,
         custom_tools_manager: ToolsManagerInterface,
-        openai_tools_manager: ToolsManagerInterface,
         tool_function_example,
         tool_method_example,
         tool_kit_example,
@@ -319,7 +336,6 @@ class TestTool:
         custom_tools_manager.add_tool(tool_function_example, "PERMANENT")
         custom_tools_manager.add_tool(tool_method_example, "TEMPORARY")
         custom_tools_manager.register_tool(tool_kit_example)
-        openai_tools_manager.add_tool(tool_function_example)
 
         # Action
         metadata_list = custom_tools_manager.get_tools_metadata(by_types=["PERMANENT"], by_names=["tool_say_hello_example"])
@@ -330,8 +346,6 @@ class TestTool:
         assert len(metadata_list) == 2
         assert isinstance(tool_bead_piece, dict)
         assert tool_bead_piece.get("role") == "system"
-        with pytest.raises(AssertionError):
-            openai_tools_manager.wrap_tools_to_bead(tools=[tool_function_example])
 
         # Action
         bead = custom_tools_manager.wrap_tools_to_bead(tools=[tool_function_example, tool_kit_example])
@@ -342,101 +356,66 @@ class TestTool:
 
     def test_tools_manual_token_num(
         self,
-        custom_tools_manager: ToolsManagerInterface,
-        openai_tools_manager: ToolsManagerInterface,
-        tool_function_example,
+        openai_with_function_tool: tuple[ToolsManagerInterface, list],
     ):
         # Setup
-        custom_tools_manager.add_tool(tool_function_example)
-        openai_tools_manager.add_tool(tool_function_example)
-
-        # Action
-        manual = openai_tools_manager.get_tools_manual(by_names=["tool_function_example"])
+        openai_tools_manager, manual = openai_with_function_tool
         
         # Assert
+        assert isinstance(manual, list)
+        assert len(manual) == 1
         assert openai_tools_manager.tools_manual_token_num(
             by_names=["tool_function_example"],
         ) == len(str(manual))
-        with pytest.raises(AssertionError):
-            custom_tools_manager.tools_manual_token_num(by_names=["tool_function_example"])
 
-    async def test_custom_parse_response(
+    @pytest.mark.parametrize(
+        "tools_manager_fixture, operation",
+        [
+            ("openai_tools_manager", lambda manager, tool: manager.wrap_tools_to_bead(tools=[tool])),
+            ("custom_tools_manager", lambda manager, tool: manager.tools_manual_token_num(by_names=[tool.__name__])),
+        ],
+        ids=["openai-wrap_tools_to_bead", "custom-tools_manual_token_num"],
+    )
+    def test_unsupported_operation(
         self,
-        custom_tools_manager: ToolsManagerInterface,
-        async_custom_llm_response,
+        request: pytest.FixtureRequest,
+        tools_manager_fixture: str,
+        operation,
+        tool_function_example,
     ):
-        # Action
-        make_role_generator = await custom_tools_manager.parse_response(async_custom_llm_response)
-        to_user_gen = make_role_generator("to_user")
-        function_call_gen = make_role_generator("tool_call")
-        to_user_list = []
-        function_call_list = []
-        async for to_user in to_user_gen:
-            to_user_list.append(to_user)
-        async for function_call in function_call_gen:
-            function_call_list.append(function_call)
+        # Setup
+        tools_manager: ToolsManagerInterface = request.getfixturevalue(tools_manager_fixture)
+        tools_manager.add_tool(tool_function_example)
 
         # Assert
-        assert ''.join(to_user_list) == ''.join(
-            [
-                "Turning off ",
-                "the light for you.",
-                "Checking the weather for you, please wait.",
-            ],
-        )
-        function_call_list_check = [
-            {
-                "name": "light_off",
-                "parameters": {},
-            },
-            {
-                "name": "get_weather",
-                "parameters": {
-                    "position": "Hangzhou",
-                    "unit": "celsius",
-                }
-            },
-        ]
-        for i in range(2):
-            assert json.loads(function_call_list[i]) == function_call_list_check[i]
-
-    async def test_openai_parse_response(
+        with pytest.raises(AssertionError):
+            operation(tools_manager, tool_function_example)
+
+    @pytest.mark.parametrize(
+        "tools_manager_fixture, response_fixture, expected_to_user, expected_tool_calls",
+        [
+            ("custom_tools_manager", "async_custom_llm_response", CUSTOM_TO_USER, CUSTOM_TOOL_CALLS),
+            ("openai_tools_manager", "async_openai_response", OPENAI_TO_USER, OPENAI_TOOL_CALLS),
+        ],
+        ids=["custom", "openai"],
+    )
+    async def test_parse_response(
         self,
-        openai_tools_manager: ToolsManagerInterface,
-        async_openai_response,
+        request: pytest.FixtureRequest,
+        tools_manager_fixture: str,
+        response_fixture: str,
+        expected_to_user: str,
+        expected_tool_calls: list[dict],
     ):
+        # Setup
+        tools_manager: ToolsManagerInterface = request.getfixturevalue(tools_manager_fixture)
+        response = request.getfixturevalue(response_fixture)
+
         # Action
-        make_role_generator = await openai_tools_manager.parse_response(async_openai_response)
-        to_user_gen = make_role_generator("to_user")
-        function_call_gen = make_role_generator("tool_call")
-        to_user_list = []
-        function_call_list = []
-        async for to_user in to_user_gen:
-            to_user_list.append(to_user)
-        async for function_call in function_call_gen:
-            function_call_list.append(function_call)
+        make_role_generator = await tools_manager.parse_response(response)
+        to_user_list = [to_user async for to_user in make_role_generator("to_user")]
+        function_call_list = [function_call async for function_call in make_role_generator("tool_call")]
 
         # Assert
-        assert ''.join(to_user_list) == ''.join(
-            [
-                'I am search \\"weather\\" for you.',
-                '\n',
-                'I am search weather in Beijing.',
-            ],
-        )
-        function_call_list_check = [
-            {
-                "tool_call_index": 0,
-                "tool_call_id": "call_vM7ZCfu7VF0curI2YwIpCNVh",
-                "name": "get_current_weather",
-                "arguments": {"location": "Paris"},
-            },
-            {
-                "tool_call_index": 1,
-                "tool_call_id": "call_AOefM0a9RMWTiJmOSDsW2mZM",
-                "name": "get_current_weather",
-                "arguments": {"location": "Beijing", "unit": "celsius"}
-            },
-        ]
-        for i in range(2):
-            assert json.loads(function_call_list[i]) == function_call_list_check[i]
+        assert ''.join(to_user_list) == expected_to_user
+        assert [json.loads(function_call) for function_call in function_call_list] == expected_tool_calls